@@ -0,0 +1,139 @@
+"""
+Column preprocessing and table classification for the enhanced generator
+
+This module has no database or YAML dependencies and is fully annotated so it
+can be compiled with mypyc (``mypyc cubedev_classify.py``); the pure-Python
+module is imported when no compiled extension is present.
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from cubedev_config import (
+    TABLE_CLASSIFICATION, COLUMN_TYPE_MAPPINGS,
+    FACT_TABLE_NAME_RE, DIMENSION_TABLE_NAME_RE, JUNCTION_TABLE_NAME_RE,
+    FACT_COLUMN_RE, DIMENSION_COLUMN_RE
+)
+
+# Substring tests on lowercased SQL types used by table classification
+_NUMERIC_TYPE_RE = re.compile(r'int|decimal|numeric|float')
+_TEXT_TYPE_RE = re.compile(r'varchar|text|char')
+
+# Table classification thresholds
+_JUNCTION_FK_THRESHOLD: int = TABLE_CLASSIFICATION['junction_table_indicators']['foreign_key_threshold']
+_JUNCTION_MAX_COLUMNS: int = TABLE_CLASSIFICATION['junction_table_indicators']['max_columns']
+_FACT_FK_THRESHOLD: int = TABLE_CLASSIFICATION['fact_table_indicators']['foreign_key_threshold']
+_FACT_NUMERIC_THRESHOLD: float = TABLE_CLASSIFICATION['fact_table_indicators']['numeric_column_threshold']
+_DIM_TEXT_THRESHOLD: float = TABLE_CLASSIFICATION['dimension_table_indicators']['text_column_threshold']
+
+@lru_cache(maxsize=1024)
+def lookup_cube_type(sql_type: str) -> Optional[str]:
+    """Cube.dev type for a SQL type string, or None when its base type is not mapped (memoized)
+
+    This is the single SQL type lookup; map_sql_type_to_cube and cubedev_utils.classify_sql_type
+    only differ in how they treat a miss.
+    """
+    base_type = sql_type.lower().partition('(')[0].strip()
+    return COLUMN_TYPE_MAPPINGS.get(base_type)
+
+def map_sql_type_to_cube(sql_type: str) -> str:
+    """Map SQL type to Cube.dev type using configuration (unmapped types become strings)"""
+    return lookup_cube_type(sql_type) or 'string'
+
+@dataclass(slots=True)
+class ColumnView:
+    """Per-column attributes of one table, computed in a single pass as parallel lists"""
+    names: List[str] = field(default_factory=list)
+    names_lower: List[str] = field(default_factory=list)
+    sql_types: List[str] = field(default_factory=list)
+    cube_types: List[str] = field(default_factory=list)
+    is_pk: List[bool] = field(default_factory=list)
+    fact_hits: List[bool] = field(default_factory=list)
+    dim_hits: List[bool] = field(default_factory=list)
+    numeric_mask: List[bool] = field(default_factory=list)
+    text_mask: List[bool] = field(default_factory=list)
+    time_dim_names: List[str] = field(default_factory=list)
+
+def build_column_view(columns: List[Dict[str, Any]], primary_keys: List[str],
+                      map_type: Callable[[str], str] = map_sql_type_to_cube) -> ColumnView:
+    """Lowercase, type-map and pattern-match every column exactly once"""
+    view = ColumnView()
+
+    # Bind hot lookups to locals for the per-column loop
+    intern = sys.intern
+    pk_set = frozenset(primary_keys)
+    fact_search = FACT_COLUMN_RE.search
+    dim_search = DIMENSION_COLUMN_RE.search
+    numeric_search = _NUMERIC_TYPE_RE.search
+    text_search = _TEXT_TYPE_RE.search
+
+    for col in columns:
+        # Names recur across tables (id, created_at, ...); interning shares one
+        # object per distinct name and lets equality checks short-circuit on identity.
+        # str() first: sys.intern rejects str subclasses such as SQLAlchemy's quoted_name
+        name = intern(str(col['name']))
+        name_lower = intern(name.lower())
+        sql_type: str = col['type']
+        col_type = sql_type.lower()
+        cube_type = map_type(sql_type)
+
+        view.names.append(name)
+        view.names_lower.append(name_lower)
+        view.sql_types.append(sql_type)
+        view.cube_types.append(cube_type)
+        view.is_pk.append(name in pk_set)
+        view.fact_hits.append(fact_search(name_lower) is not None)
+        view.dim_hits.append(dim_search(name_lower) is not None)
+        view.numeric_mask.append(numeric_search(col_type) is not None)
+        view.text_mask.append(text_search(col_type) is not None)
+        if cube_type == 'time':
+            view.time_dim_names.append(name)
+
+    return view
+
+def classify_table_name(table_name: str) -> Optional[str]:
+    """Classify a table from its name patterns alone, or None if no pattern applies"""
+    table_name = table_name.lower()
+
+    if FACT_TABLE_NAME_RE.search(table_name):
+        return 'fact'
+
+    if DIMENSION_TABLE_NAME_RE.search(table_name):
+        return 'dimension'
+
+    if JUNCTION_TABLE_NAME_RE.search(table_name):
+        return 'junction'
+
+    return None
+
+def classify_table_columns(view: ColumnView, fk_count: int) -> str:
+    """Classify a table from its column view and foreign key count"""
+    # Count column types and score based on column patterns
+    numeric_count: int = sum(view.numeric_mask)
+    text_count: int = sum(view.text_mask)
+    fact_score: int = 2 * sum(view.fact_hits)
+    dim_score: int = 2 * sum(view.dim_hits)
+    total_cols = len(view.names)
+
+    # Calculate ratios
+    numeric_ratio = numeric_count / total_cols if total_cols > 0 else 0.0
+    text_ratio = text_count / total_cols if total_cols > 0 else 0.0
+
+    # Apply classification rules
+    if fk_count >= _JUNCTION_FK_THRESHOLD and total_cols <= _JUNCTION_MAX_COLUMNS:
+        return 'junction'
+
+    if fk_count >= _FACT_FK_THRESHOLD and numeric_ratio >= _FACT_NUMERIC_THRESHOLD:
+        return 'fact'
+
+    if text_ratio >= _DIM_TEXT_THRESHOLD:
+        return 'dimension'
+
+    # Default classification based on scores
+    if fact_score > dim_score:
+        return 'fact'
+    else:
+        return 'dimension'
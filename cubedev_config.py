@@ -1,7 +1,11 @@
 # Configuration for PostgreSQL to Cube.dev YAML Generator
 
+import re
+from types import MappingProxyType
+from typing import Any, Mapping
+
 # Database Connection Templates
-DATABASE_CONFIGS = {
+DATABASE_CONFIGS: Mapping[str, Any] = {
     "development": {
         "host": "localhost",
         "port": 5432,
@@ -29,7 +33,7 @@ DATABASE_CONFIGS = {
 }
 
 # Table Classification Rules
-TABLE_CLASSIFICATION = {
+TABLE_CLASSIFICATION: Mapping[str, Any] = {
     "fact_table_indicators": {
         "name_patterns": [
             "fact_", "sales_", "orders_", "transactions_", "events_", 
@@ -69,7 +73,7 @@ TABLE_CLASSIFICATION = {
 }
 
 # Column Type Mapping Configuration
-COLUMN_TYPE_MAPPINGS = {
+COLUMN_TYPE_MAPPINGS: Mapping[str, Any] = {
     # Numeric types
     "integer": "number",
     "bigint": "number", 
@@ -81,6 +85,15 @@ COLUMN_TYPE_MAPPINGS = {
     "double precision": "number",
     "float": "number",
     "money": "number",
+    # PostgreSQL internal names and serial pseudo-types
+    "int2": "number",
+    "int4": "number",
+    "int8": "number",
+    "float4": "number",
+    "float8": "number",
+    "smallserial": "number",
+    "serial": "number",
+    "bigserial": "number",
     
     # String types
     "varchar": "string",
@@ -119,7 +132,7 @@ COLUMN_TYPE_MAPPINGS = {
 }
 
 # Measure Generation Rules
-MEASURE_GENERATION_RULES = {
+MEASURE_GENERATION_RULES: Mapping[str, Any] = {
     "default_measures": [
         {
             "name": "count",
@@ -160,7 +173,7 @@ MEASURE_GENERATION_RULES = {
 }
 
 # Dimension Generation Rules
-DIMENSION_GENERATION_RULES = {
+DIMENSION_GENERATION_RULES: Mapping[str, Any] = {
     "time_dimensions": {
         "patterns": ["created_at", "updated_at", "timestamp", "date", "time"],
         "granularities": [
@@ -197,7 +210,7 @@ DIMENSION_GENERATION_RULES = {
 }
 
 # Segment Generation Rules  
-SEGMENT_GENERATION_RULES = {
+SEGMENT_GENERATION_RULES: Mapping[str, Any] = {
     "status_segments": {
         "patterns": ["status", "state", "is_active", "active", "enabled"],
         "segments": [
@@ -248,7 +261,7 @@ SEGMENT_GENERATION_RULES = {
 }
 
 # Pre-aggregation Configuration
-PRE_AGGREGATION_CONFIG = {
+PRE_AGGREGATION_CONFIG: Mapping[str, Any] = {
     "fact_tables": {
         "default_granularity": "day",
         "partition_granularity": "month",
@@ -268,7 +281,7 @@ PRE_AGGREGATION_CONFIG = {
 }
 
 # View Generation Configuration
-VIEW_GENERATION_CONFIG = {
+VIEW_GENERATION_CONFIG: Mapping[str, Any] = {
     "business_metrics_view": {
         "name": "business_metrics",
         "description": "Key business metrics across all entities",
@@ -305,7 +318,7 @@ VIEW_GENERATION_CONFIG = {
 }
 
 # Output Configuration
-OUTPUT_CONFIG = {
+OUTPUT_CONFIG: Mapping[str, Any] = {
     "directory_structure": {
         "cubes": "cubes",
         "views": "views", 
@@ -328,7 +341,7 @@ OUTPUT_CONFIG = {
 }
 
 # Validation Rules
-VALIDATION_RULES = {
+VALIDATION_RULES: Mapping[str, Any] = {
     "cube_validation": {
         "required_fields": ["name", "sql_table"],
         "recommended_fields": ["measures", "dimensions"],
@@ -349,7 +362,7 @@ VALIDATION_RULES = {
 }
 
 # Domain-Specific Templates
-DOMAIN_TEMPLATES = {
+DOMAIN_TEMPLATES: Mapping[str, Any] = {
     "ecommerce": {
         "fact_tables": ["orders", "order_items", "payments"],
         "dimension_tables": ["customers", "products", "categories"],
@@ -371,3 +384,59 @@ DOMAIN_TEMPLATES = {
         "key_dimensions": ["transaction_date", "account_id", "asset_id"]
     }
 }
+
+# Read-only views of the top-level configuration
+DATABASE_CONFIGS = MappingProxyType(DATABASE_CONFIGS)
+TABLE_CLASSIFICATION = MappingProxyType(TABLE_CLASSIFICATION)
+COLUMN_TYPE_MAPPINGS = MappingProxyType(COLUMN_TYPE_MAPPINGS)
+MEASURE_GENERATION_RULES = MappingProxyType(MEASURE_GENERATION_RULES)
+DIMENSION_GENERATION_RULES = MappingProxyType(DIMENSION_GENERATION_RULES)
+SEGMENT_GENERATION_RULES = MappingProxyType(SEGMENT_GENERATION_RULES)
+PRE_AGGREGATION_CONFIG = MappingProxyType(PRE_AGGREGATION_CONFIG)
+VIEW_GENERATION_CONFIG = MappingProxyType(VIEW_GENERATION_CONFIG)
+OUTPUT_CONFIG = MappingProxyType(OUTPUT_CONFIG)
+VALIDATION_RULES = MappingProxyType(VALIDATION_RULES)
+DOMAIN_TEMPLATES = MappingProxyType(DOMAIN_TEMPLATES)
+
+# Derived indexes, computed once at import
+def _compile_terms(terms):
+    """Compile substring patterns into one alternation (matches if any term occurs)"""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+FACT_TABLE_NAME_RE = _compile_terms(TABLE_CLASSIFICATION['fact_table_indicators']['name_patterns'])
+DIMENSION_TABLE_NAME_RE = _compile_terms(TABLE_CLASSIFICATION['dimension_table_indicators']['name_patterns'])
+JUNCTION_TABLE_NAME_RE = _compile_terms(TABLE_CLASSIFICATION['junction_table_indicators']['name_patterns'])
+FACT_COLUMN_RE = _compile_terms(TABLE_CLASSIFICATION['fact_table_indicators']['column_patterns'])
+DIMENSION_COLUMN_RE = _compile_terms(TABLE_CLASSIFICATION['dimension_table_indicators']['column_patterns'])
+# Numeric columns holding money, formatted as currency
+CURRENCY_COLUMN_RE = _compile_terms(('amount', 'price', 'cost', 'value', 'total'))
+
+def _compile_first_rule(rules):
+    """Compile rule patterns so match().lastgroup names the first rule, in order, with a term present"""
+    return re.compile('|'.join(
+        f"(?=.*?(?P<{name}>{'|'.join(map(re.escape, config['patterns']))}))"
+        for name, config in rules.items()
+    ))
+
+def _compile_all_rules(rules):
+    """Compile rule patterns so match().groupdict() is set for every rule with a term present"""
+    return re.compile(''.join(
+        f"(?:(?=.*?(?P<{name}>{'|'.join(map(re.escape, config['patterns']))})))?"
+        for name, config in rules.items()
+    ))
+
+NUMERIC_MEASURE_RULE_RE = _compile_first_rule(MEASURE_GENERATION_RULES['numeric_measures'])
+SEGMENT_RULE_RE = _compile_all_rules(SEGMENT_GENERATION_RULES)
+
+def _compile_term_counter(terms):
+    """Compile terms so the number of non-None groups in match() is how many terms occur anywhere"""
+    return re.compile(''.join(
+        f"(?:(?=.*?({re.escape(term)})))?" for term in terms
+    ), re.DOTALL)
+
+# One counter per non-generic domain, over its fact and dimension table names
+DOMAIN_TABLE_RES = MappingProxyType({
+    domain: _compile_term_counter([*config['fact_tables'], *config['dimension_tables']])
+    for domain, config in DOMAIN_TEMPLATES.items()
+    if domain != 'generic'
+})
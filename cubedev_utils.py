@@ -4,29 +4,159 @@ Utility functions for PostgreSQL to Cube.dev YAML generation
 
 import re
 import os
+import json
+import hashlib
+import queue
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union, ClassVar, Set, Callable, TextIO, BinaryIO, Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 import yaml
 from datetime import datetime
 
+# Prefer the libyaml C bindings, fall back to the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _Loader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _Loader
+    LIBYAML_AVAILABLE = False
+
+
+class _Dumper(_SafeDumper):
+    """Safe dumper that writes shared sub-structures (granularity lists) inline instead of as &id anchors"""
+    
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+class FlowMapping(dict):
+    """Small mapping that YAML output writes inline ({name: day, interval: 1 day}) instead of as a block"""
+
+_Dumper.add_representer(
+    FlowMapping, lambda dumper, data: dumper.represent_mapping('tag:yaml.org,2002:map', data, flow_style=True)
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from cubedev_classify import lookup_cube_type
+
 logger = logging.getLogger(__name__)
 
+def dumps_json(data: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=default).encode('utf-8')
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed (raises ValueError on bad input)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Precompiled name patterns
+_SANITIZE_INVALID = re.compile(r'[^a-z0-9_]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_NAME_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+
+# Column purpose keywords
+_IDENTIFIER_NAMES = ('id', 'uuid')
+_TIME_TERMS = ('date', 'time', 'timestamp', 'created', 'updated')
+_FINANCIAL_TERMS = ('amount', 'price', 'cost', 'value', 'total', 'revenue')
+_METRIC_TERMS = ('quantity', 'count', 'volume', 'weight', 'score')
+_CATEGORICAL_TERMS = ('status', 'type', 'category', 'state', 'kind')
+_DESCRIPTIVE_TERMS = ('name', 'title', 'description', 'label')
+_PERCENT_TERMS = ('percent', 'rate')
+_BOOLEAN_PREFIXES = ('is_', 'has_')
+_DIMENSION_TABLE_TERMS = ('dim_', '_dim', 'lookup', 'reference')
+
+_DIMENSION_TABLE_RE = re.compile('|'.join(map(re.escape, _DIMENSION_TABLE_TERMS)))
+
+# SQL expression templates for generate_sql_expression
+_SQL_TEMPLATES = MappingProxyType({
+    'count': "COUNT(*)",
+    'count_distinct': "COUNT(DISTINCT {{{alias}}}.{col})",
+    'sum': "SUM({{{alias}}}.{col})",
+    'avg': "AVG({{{alias}}}.{col})",
+    'min': "MIN({{{alias}}}.{col})",
+    'max': "MAX({{{alias}}}.{col})",
+    'concat_names': "CONCAT({{{alias}}}.first_name, ' ', {{{alias}}}.last_name)",
+    'year_from_date': "EXTRACT(YEAR FROM {{{alias}}}.{col})",
+    'month_from_date': "EXTRACT(MONTH FROM {{{alias}}}.{col})",
+    'day_from_date': "EXTRACT(DAY FROM {{{alias}}}.{col})"
+})
+
+# Keyword -> (priority, purpose); earlier categories win when several match
+_PURPOSE_CATEGORIES = (
+    ('time', _TIME_TERMS),
+    ('financial', _FINANCIAL_TERMS),
+    ('metric', _METRIC_TERMS),
+    ('categorical', _CATEGORICAL_TERMS),
+    ('descriptive', _DESCRIPTIVE_TERMS),
+)
+_TERM_PURPOSE: Dict[str, Tuple[int, str]] = {}
+for _rank, (_purpose, _terms) in enumerate(_PURPOSE_CATEGORIES):
+    for _term in _terms:
+        _TERM_PURPOSE.setdefault(_term, (_rank, _purpose))
+
+# Zero-width lookahead so overlapping keywords (e.g. 'time' in 'timestamp')
+# are all reported in a single scan
+_PURPOSE_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _TERM_PURPOSE)))
+
+# Shared "generated on" timestamp for every file written in a run
+_run_timestamp: Optional[str] = None
+
+def _get_run_timestamp() -> str:
+    """Return the timestamp for the current generation run"""
+    global _run_timestamp
+    if _run_timestamp is None:
+        _run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return _run_timestamp
+
+def reset_run_timestamp() -> None:
+    """Start a new run so the next header/index gets a fresh timestamp"""
+    global _run_timestamp
+    _run_timestamp = None
+
+class ColumnKind(Enum):
+    """Broad SQL column type families, keyed by their Cube.dev type"""
+    NUMERIC = 'number'
+    STRING = 'string'
+    TIME = 'time'
+    BOOLEAN = 'boolean'
+    OTHER = 'other'
+
+@lru_cache(maxsize=1024)
+def classify_sql_type(sql_type: str) -> ColumnKind:
+    """Classify a SQL type string once so every analysis pass can reuse it"""
+    cube_type = lookup_cube_type(sql_type)
+    return ColumnKind(cube_type) if cube_type else ColumnKind.OTHER
+
 class CubeDevUtils:
     """Utility functions for Cube.dev YAML generation"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def sanitize_name(name: str) -> str:
         """Sanitize a name to be Cube.dev compliant"""
         # Convert to lowercase and replace invalid characters
-        sanitized = re.sub(r'[^a-z0-9_]', '_', name.lower())
+        sanitized = _SANITIZE_INVALID.sub('_', name.lower())
         
         # Ensure it starts with a letter
         if not sanitized[0].isalpha():
             sanitized = 'col_' + sanitized
         
         # Remove multiple underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _MULTI_UNDERSCORE.sub('_', sanitized)
         
         # Remove trailing underscores
         sanitized = sanitized.strip('_')
@@ -34,41 +164,28 @@ class CubeDevUtils:
         return sanitized
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def detect_column_purpose(column_name: str, column_type: str) -> str:
         """Detect the purpose/category of a column"""
         col_name = column_name.lower()
         
         # Primary key detection
-        if col_name in ['id', 'uuid'] or col_name.endswith('_id'):
+        if col_name in _IDENTIFIER_NAMES or col_name.endswith('_id'):
             return 'identifier'
         
-        # Time column detection
-        if any(term in col_name for term in ['date', 'time', 'timestamp', 'created', 'updated']):
-            return 'time'
-        
-        # Financial column detection
-        if any(term in col_name for term in ['amount', 'price', 'cost', 'value', 'total', 'revenue']):
-            return 'financial'
-        
-        # Quantity/metric detection
-        if any(term in col_name for term in ['quantity', 'count', 'volume', 'weight', 'score']):
-            return 'metric'
-        
-        # Status/category detection
-        if any(term in col_name for term in ['status', 'type', 'category', 'state', 'kind']):
-            return 'categorical'
-        
-        # Name/description detection
-        if any(term in col_name for term in ['name', 'title', 'description', 'label']):
-            return 'descriptive'
+        # Keyword-based detection (time, financial, metric, categorical, descriptive)
+        hits = [_TERM_PURPOSE[m.group(1)] for m in _PURPOSE_RE.finditer(col_name)]
+        if hits:
+            return min(hits)[1]
         
         # Boolean detection
-        if col_name.startswith('is_') or col_name.startswith('has_') or 'boolean' in column_type.lower():
+        if col_name.startswith(_BOOLEAN_PREFIXES) or classify_sql_type(column_type) is ColumnKind.BOOLEAN:
             return 'boolean'
         
         return 'generic'
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def generate_description(entity_name: str, entity_type: str, context: str = None) -> str:
         """Generate a descriptive text for cubes, measures, dimensions"""
         entity_name_formatted = entity_name.replace('_', ' ').title()
@@ -91,7 +208,7 @@ class CubeDevUtils:
         
         if column_purpose == 'financial':
             return 'currency'
-        elif 'percent' in col_name or 'rate' in col_name:
+        elif any(term in col_name for term in _PERCENT_TERMS):
             return 'percent'
         elif column_purpose == 'metric':
             return 'number'
@@ -118,20 +235,20 @@ class CubeDevUtils:
     def generate_sql_expression(column_name: str, operation: str, table_alias: str = "CUBE") -> str:
         """Generate SQL expressions for measures and dimensions"""
         
-        expressions = {
-            'count': f"COUNT(*)",
-            'count_distinct': f"COUNT(DISTINCT {{{table_alias}}}.{column_name})",
-            'sum': f"SUM({{{table_alias}}}.{column_name})",
-            'avg': f"AVG({{{table_alias}}}.{column_name})",
-            'min': f"MIN({{{table_alias}}}.{column_name})",
-            'max': f"MAX({{{table_alias}}}.{column_name})",
-            'concat_names': f"CONCAT({{{table_alias}}}.first_name, ' ', {{{table_alias}}}.last_name)",
-            'year_from_date': f"EXTRACT(YEAR FROM {{{table_alias}}}.{column_name})",
-            'month_from_date': f"EXTRACT(MONTH FROM {{{table_alias}}}.{column_name})",
-            'day_from_date': f"EXTRACT(DAY FROM {{{table_alias}}}.{column_name})"
-        }
-        
-        return expressions.get(operation, f"{{{table_alias}}}.{column_name}")
+        template = _SQL_TEMPLATES.get(operation)
+        if template is None:
+            return f"{{{table_alias}}}.{column_name}"
+        
+        return template.format(alias=table_alias, col=column_name)
+
+def reset_state() -> None:
+    """Clear memoized caches and the run timestamp between generation runs"""
+    CubeDevUtils.sanitize_name.cache_clear()
+    CubeDevUtils.detect_column_purpose.cache_clear()
+    CubeDevUtils.generate_description.cache_clear()
+    classify_sql_type.cache_clear()
+    lookup_cube_type.cache_clear()
+    reset_run_timestamp()
 
 class YAMLFormatter:
     """Handle YAML formatting and output"""
@@ -141,6 +258,7 @@ class YAMLFormatter:
         """Format cube data as YAML string"""
         return yaml.dump(
             {'cubes': [cube_data]}, 
+            Dumper=_Dumper,
             default_flow_style=False, 
             sort_keys=False, 
             indent=2,
@@ -152,18 +270,47 @@ class YAMLFormatter:
         """Format view data as YAML string"""
         return yaml.dump(
             {'views': [view_data]}, 
+            Dumper=_Dumper,
             default_flow_style=False, 
             sort_keys=False, 
             indent=2,
             allow_unicode=True
         )
     
+    @staticmethod
+    def dump_cube_yaml(cube_data: Dict[str, Any], stream: Union[TextIO, BinaryIO], encoding: Optional[str] = None) -> None:
+        """Write cube data as YAML directly to an open stream (binary if encoding is given)"""
+        yaml.dump(
+            {'cubes': [cube_data]}, 
+            stream,
+            Dumper=_Dumper,
+            default_flow_style=False, 
+            sort_keys=False, 
+            indent=2,
+            allow_unicode=True,
+            encoding=encoding
+        )
+    
+    @staticmethod
+    def dump_view_yaml(view_data: Dict[str, Any], stream: Union[TextIO, BinaryIO], encoding: Optional[str] = None) -> None:
+        """Write view data as YAML directly to an open stream (binary if encoding is given)"""
+        yaml.dump(
+            {'views': [view_data]}, 
+            stream,
+            Dumper=_Dumper,
+            default_flow_style=False, 
+            sort_keys=False, 
+            indent=2,
+            allow_unicode=True,
+            encoding=encoding
+        )
+    
     @staticmethod
     def add_yaml_header(content: str, metadata: Dict[str, Any]) -> str:
         """Add header comments to YAML content"""
         header_lines = [
             "# Generated Cube.dev YAML Configuration",
-            f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"# Generated on: {_get_run_timestamp()}",
             f"# Database: {metadata.get('database', 'N/A')}",
             f"# Schema: {metadata.get('schema', 'N/A')}",
             f"# Generator: PostgreSQL to Cube.dev YAML Generator",
@@ -176,57 +323,110 @@ class YAMLFormatter:
     @staticmethod
     def validate_yaml_syntax(yaml_content: str) -> Tuple[bool, Optional[str]]:
         """Validate YAML syntax"""
+        # Fast-reject obviously empty input before invoking the parser
+        if not yaml_content or yaml_content.isspace():
+            return False, "YAML content is empty"
+        
         try:
-            yaml.safe_load(yaml_content)
+            # Constructing with the safe loader also rejects unsafe tags (e.g. !!python/object)
+            yaml.load(yaml_content, Loader=_Loader)
             return True, None
         except yaml.YAMLError as e:
             return False, str(e)
 
+@dataclass(slots=True, frozen=True)
+class ColumnInfo:
+    """Column record used by DatabaseAnalyzer"""
+    name: str
+    type: str = ''
+
+@dataclass(slots=True, frozen=True)
+class ForeignKeyInfo:
+    """Foreign key record used by DatabaseAnalyzer"""
+    referred_table: Optional[str]
+    constrained_columns: Tuple[str, ...] = ()
+    referred_columns: Tuple[str, ...] = ()
+
+@dataclass(slots=True, frozen=True)
+class TableSummary:
+    """Table record used by DatabaseAnalyzer"""
+    name: str
+    columns: Tuple[ColumnInfo, ...] = ()
+    foreign_keys: Tuple[ForeignKeyInfo, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, table: Dict[str, Any]) -> 'TableSummary':
+        """Build a table summary from the dict form produced by introspection"""
+        return cls(
+            name=table['name'],
+            columns=tuple(
+                ColumnInfo(col['name'], col.get('type', ''))
+                for col in table.get('columns', [])
+            ),
+            foreign_keys=tuple(
+                ForeignKeyInfo(
+                    fk.get('referred_table'),
+                    tuple(fk.get('constrained_columns', ())),
+                    tuple(fk.get('referred_columns', ()))
+                )
+                for fk in table.get('foreign_keys', [])
+            )
+        )
+
+TableLike = Union[TableSummary, Dict[str, Any]]
+
+def _as_table_summary(table: TableLike) -> TableSummary:
+    """Accept either a TableSummary or its dict form"""
+    if isinstance(table, TableSummary):
+        return table
+    return TableSummary.from_dict(table)
+
 class DatabaseAnalyzer:
     """Analyze database patterns and relationships"""
     
     @staticmethod
-    def analyze_table_relationships(tables_info: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    def iter_relationships(tables_info: Iterable[TableLike]) -> Iterator[Tuple[str, str]]:
+        """Yield (table, referenced_table) edges without materializing them"""
+        for table in map(_as_table_summary, tables_info):
+            for fk in table.foreign_keys:
+                if fk.referred_table:
+                    yield table.name, fk.referred_table
+    
+    @staticmethod
+    def analyze_table_relationships(tables_info: List[TableLike]) -> Dict[str, List[str]]:
         """Analyze relationships between tables"""
-        relationships = {}
+        tables = [_as_table_summary(table) for table in tables_info]
+        relationships = {table.name: [] for table in tables}
         
-        for table in tables_info:
-            table_name = table['name']
-            relationships[table_name] = []
-            
-            # Find tables this table references
-            for fk in table.get('foreign_keys', []):
-                referenced_table = fk.get('referred_table')
-                if referenced_table:
-                    relationships[table_name].append(referenced_table)
+        # Find tables each table references
+        for table_name, referenced_table in DatabaseAnalyzer.iter_relationships(tables):
+            relationships[table_name].append(referenced_table)
         
         return relationships
     
     @staticmethod
-    def detect_fact_dimension_pattern(tables_info: List[Dict[str, Any]]) -> Dict[str, str]:
+    def detect_fact_dimension_pattern(tables_info: List[TableLike]) -> Dict[str, str]:
         """Detect fact and dimension tables based on patterns"""
         table_classifications = {}
         
-        for table in tables_info:
-            table_name = table['name']
+        for table in map(_as_table_summary, tables_info):
+            table_name = table.name
             
             # Count foreign keys and numeric columns
-            fk_count = len(table.get('foreign_keys', []))
-            numeric_cols = sum(1 for col in table.get('columns', []) 
-                             if 'int' in col.get('type', '').lower() or 
-                                'decimal' in col.get('type', '').lower() or
-                                'numeric' in col.get('type', '').lower())
+            fk_count = len(table.foreign_keys)
+            numeric_cols = sum(1 for col in table.columns
+                               if classify_sql_type(col.type) is ColumnKind.NUMERIC)
             
-            total_cols = len(table.get('columns', []))
+            total_cols = len(table.columns)
             
             # Classification logic
             if fk_count >= 2 and total_cols <= 6:
                 table_classifications[table_name] = 'junction'
             elif fk_count >= 2 and numeric_cols > 0:
                 table_classifications[table_name] = 'fact'
-            elif any(term in table_name.lower() for term in ['dim_', '_dim', 'lookup', 'reference']):
+            elif _DIMENSION_TABLE_RE.search(table_name.lower()):
                 table_classifications[table_name] = 'dimension'
-            elif numeric_cols / total_cols > 0.3 and fk_count > 0:
+            elif total_cols and numeric_cols / total_cols > 0.3 and fk_count > 0:
                 table_classifications[table_name] = 'fact'
             else:
                 table_classifications[table_name] = 'dimension'
@@ -234,22 +434,26 @@ class DatabaseAnalyzer:
         return table_classifications
     
     @staticmethod
-    def suggest_pre_aggregations(table_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def suggest_pre_aggregations(table_info: TableLike) -> List[Dict[str, Any]]:
         """Suggest pre-aggregations based on table structure"""
-        suggestions = []
+        return list(DatabaseAnalyzer.iter_pre_aggregation_suggestions(table_info))
+    
+    @staticmethod
+    def iter_pre_aggregation_suggestions(table_info: TableLike) -> Iterator[Dict[str, Any]]:
+        """Yield pre-aggregation suggestions lazily"""
+        table = _as_table_summary(table_info)
         
         # Find time columns
-        time_columns = [col['name'] for col in table_info.get('columns', []) 
-                       if 'timestamp' in col.get('type', '').lower() or 
-                          'date' in col.get('type', '').lower()]
+        time_columns = [col.name for col in table.columns 
+                       if classify_sql_type(col.type) is ColumnKind.TIME]
         
         # Find categorical columns with low cardinality
-        categorical_columns = [col['name'] for col in table_info.get('columns', [])
-                             if any(term in col['name'].lower() 
+        categorical_columns = [col.name for col in table.columns
+                             if any(term in col.name.lower() 
                                    for term in ['status', 'type', 'category', 'state'])]
         
         if time_columns and categorical_columns:
-            suggestion = {
+            yield {
                 'name': 'main_rollup',
                 'time_dimension': time_columns[0],
                 'granularity': 'day',
@@ -257,129 +461,242 @@ class DatabaseAnalyzer:
                 'measures': ['count'],
                 'refresh_key': {'every': '1 hour'}
             }
-            suggestions.append(suggestion)
-        
-        return suggestions
+
+class BackgroundWriter:
+    """Run file saves on one writer thread fed by a bounded queue"""
+    
+    _STOP = object()
+    
+    def __init__(self, max_pending: int = 64):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._drain, name='yaml-writer', daemon=True)
+        self._thread.start()
+    
+    def __enter__(self) -> 'BackgroundWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _drain(self) -> None:
+        """Execute queued saves in order until stopped"""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            
+            future, fn, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    # Even SystemExit is only recorded: a dead writer would leave this future
+                    # unresolved and block submit() forever once the queue filled
+                    future.set_exception(e)
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue a save, blocking while max_pending saves are outstanding"""
+        future = Future()
+        self._queue.put((future, fn, args))
+        return future
+    
+    def close(self) -> None:
+        """Wait for all queued saves to finish and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
 
 class FileManager:
     """Manage file operations for generated YAML files"""
     
+    # Output roots whose subdirectories were already created in this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+    _ensured_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, base_output_dir: str):
         self.base_dir = Path(base_output_dir)
         self.cubes_dir = self.base_dir / "cubes"
         self.views_dir = self.base_dir / "views"
         self.macros_dir = self.base_dir / "macros"
         
-        # Create directories
-        self.cubes_dir.mkdir(parents=True, exist_ok=True)
-        self.views_dir.mkdir(parents=True, exist_ok=True)
-        self.macros_dir.mkdir(parents=True, exist_ok=True)
+        # Create directories (once per output root)
+        with FileManager._ensured_lock:
+            if self.base_dir not in FileManager._ensured_dirs:
+                for directory in (self.cubes_dir, self.views_dir, self.macros_dir):
+                    directory.mkdir(parents=True, exist_ok=True)
+                FileManager._ensured_dirs.add(self.base_dir)
+                if not LIBYAML_AVAILABLE:
+                    logger.warning("PyYAML was built without libyaml; YAML output uses the slower "
+                                   "pure-Python emitter (reinstall PyYAML with libyaml for faster writes)")
     
-    def save_cube_file(self, cube_data: Dict[str, Any], filename: str = None) -> str:
-        """Save cube YAML file"""
+    def _introspection_cache_path(self, key: str) -> Path:
+        """Cache file for one database/schema key"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.base_dir / ".cache" / f"introspection_{digest}.json"
+    
+    def load_introspection_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load cached introspection data for a key, or None if missing or unreadable"""
+        filepath = self._introspection_cache_path(key)
+        try:
+            data = loads_json(filepath.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(data, dict) or data.get('key') != key:
+            return None
+        return data
+    
+    def save_introspection_cache(self, key: str, data: Dict[str, Any]) -> str:
+        """Save introspection data for a key"""
+        filepath = self._introspection_cache_path(key)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temporary file first so an interrupted run never leaves a truncated cache
+        tmp_path = filepath.with_suffix('.tmp')
+        tmp_path.write_bytes(dumps_json({**data, 'key': key}, default=str))
+        os.replace(tmp_path, filepath)
+        
+        logger.debug("Saved introspection cache: %s", filepath)
+        return str(filepath)
+    
+    def _cube_target(self, cube_data: Dict[str, Any], filename: str = None) -> Tuple[Path, Dict[str, Any]]:
+        """Resolve the output path and the data to serialize for a cube"""
         if not filename:
             filename = f"{cube_data['name']}.yml"
         
         # Remove _metadata before saving (Cube.dev doesn't support it)
-        cube_data_clean = cube_data.copy()
-        if '_metadata' in cube_data_clean:
-            del cube_data_clean['_metadata']
+        cube_data_clean = {k: v for k, v in cube_data.items() if k != '_metadata'}
         
-        filepath = self.cubes_dir / filename
-        content = YAMLFormatter.format_cube_yaml(cube_data_clean)
+        return self.cubes_dir / filename, cube_data_clean
+    
+    def _view_target(self, view_data: Dict[str, Any], filename: str = None) -> Tuple[Path, Dict[str, Any]]:
+        """Resolve the output path and the data to serialize for a view"""
+        if not filename:
+            filename = f"{view_data['name']}.yml"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return self.views_dir / filename, view_data
+    
+    @staticmethod
+    def _write_yaml(filepath: Path, data: Dict[str, Any], dump: Callable[..., None]) -> None:
+        """Stream encoded YAML into the file without building the whole document in memory"""
+        # The emitter already buffers and encodes, so skip the text layer and write bytes
+        with open(filepath, 'wb') as f:
+            dump(data, f, 'utf-8')
+    
+    @classmethod
+    def _write_files(cls, targets: List[Tuple[Path, Dict[str, Any]]],
+                     dump: Callable[..., None]) -> None:
+        """Write YAML files, overlapping the I/O across a thread pool"""
+        if len(targets) <= 1:
+            for filepath, data in targets:
+                cls._write_yaml(filepath, data, dump)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(targets))) as executor:
+            list(executor.map(lambda target: cls._write_yaml(target[0], target[1], dump), targets))
+    
+    def save_cube_file(self, cube_data: Dict[str, Any], filename: str = None) -> str:
+        """Save cube YAML file"""
+        filepath, cube_data_clean = self._cube_target(cube_data, filename)
+        self._write_yaml(filepath, cube_data_clean, YAMLFormatter.dump_cube_yaml)
         
-        logger.info(f"Saved cube file: {filepath}")
+        logger.info("Saved cube file: %s", filepath)
         return str(filepath)
     
     def save_view_file(self, view_data: Dict[str, Any], filename: str = None) -> str:
         """Save view YAML file"""
-        if not filename:
-            filename = f"{view_data['name']}.yml"
+        filepath, view_data = self._view_target(view_data, filename)
+        self._write_yaml(filepath, view_data, YAMLFormatter.dump_view_yaml)
         
-        filepath = self.views_dir / filename
-        content = YAMLFormatter.format_view_yaml(view_data)
+        logger.info("Saved view file: %s", filepath)
+        return str(filepath)
+    
+    def save_cubes_bulk(self, cubes: List[Dict[str, Any]]) -> List[str]:
+        """Save many cube YAML files in one batch"""
+        targets = [self._cube_target(cube) for cube in cubes]
+        self._write_files(targets, YAMLFormatter.dump_cube_yaml)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        logger.info(f"Saved {len(targets)} cube files to: {self.cubes_dir}")
+        return [str(filepath) for filepath, _ in targets]
+    
+    def save_views_bulk(self, views: List[Dict[str, Any]]) -> List[str]:
+        """Save many view YAML files in one batch"""
+        targets = [self._view_target(view) for view in views]
+        self._write_files(targets, YAMLFormatter.dump_view_yaml)
         
-        logger.info(f"Saved view file: {filepath}")
-        return str(filepath)
+        logger.info(f"Saved {len(targets)} view files to: {self.views_dir}")
+        return [str(filepath) for filepath, _ in targets]
     
     def create_index_file(self, generated_files: List[str]) -> str:
         """Create an index file listing all generated files"""
-        index_content = [
-            "# Generated Cube.dev Files Index",
-            f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Generated Files:",
-            ""
-        ]
-        
-        # Group files by type
-        cube_files = [f for f in generated_files if '/cubes/' in f]
-        view_files = [f for f in generated_files if '/views/' in f]
-        
-        if cube_files:
-            index_content.extend([
-                "### Cubes:",
-                ""
-            ])
-            for file in sorted(cube_files):
-                filename = Path(file).name
-                index_content.append(f"- {filename}")
-            index_content.append("")
-        
-        if view_files:
-            index_content.extend([
-                "### Views:",
-                ""
-            ])
-            for file in sorted(view_files):
-                filename = Path(file).name
-                index_content.append(f"- {filename}")
-            index_content.append("")
-        
-        index_content.extend([
-            f"**Total Files Generated:** {len(generated_files)}",
-            "",
-            "## Usage:",
-            "",
-            "1. Copy the generated files to your Cube.dev project",
-            "2. Update database connection settings in cube.js",
-            "3. Review and customize the generated cubes and views",
-            "4. Run `cube validate` to check for any issues",
-            ""
-        ])
-        
+        # Write straight into the file rather than building the whole text first
         index_filepath = self.base_dir / "README.md"
         with open(index_filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(index_content))
+            w = f.write
+            
+            w("# Generated Cube.dev Files Index\n")
+            w(f"# Generated on: {_get_run_timestamp()}\n")
+            w("\n## Generated Files:\n\n")
+            
+            # Group files by type
+            cube_files = []
+            view_files = []
+            for file in generated_files:
+                parent = Path(file).parent.name
+                if parent == 'cubes':
+                    cube_files.append(file)
+                elif parent == 'views':
+                    view_files.append(file)
+            
+            if cube_files:
+                cube_files.sort()
+                w("### Cubes:\n\n")
+                for file in cube_files:
+                    w(f"- {Path(file).name}\n")
+                w("\n")
+            
+            if view_files:
+                view_files.sort()
+                w("### Views:\n\n")
+                for file in view_files:
+                    w(f"- {Path(file).name}\n")
+                w("\n")
+            
+            w(f"**Total Files Generated:** {len(generated_files)}\n")
+            w("\n## Usage:\n\n")
+            w("1. Copy the generated files to your Cube.dev project\n")
+            w("2. Update database connection settings in cube.js\n")
+            w("3. Review and customize the generated cubes and views\n")
+            w("4. Run `cube validate` to check for any issues\n")
         
         logger.info(f"Created index file: {index_filepath}")
         return str(index_filepath)
     
+    @staticmethod
+    def _move_yml_files(src_dir: Path, dst_dir: Path) -> bool:
+        """Move *.yml files from src_dir into dst_dir in a single directory scan"""
+        if not src_dir.exists():
+            return False
+        
+        moved = False
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.yml') and entry.is_file():
+                    if not moved:
+                        dst_dir.mkdir(parents=True, exist_ok=True)
+                        moved = True
+                    os.replace(entry.path, dst_dir / entry.name)
+        
+        return moved
+    
     def backup_existing_files(self) -> bool:
         """Backup existing files before generating new ones"""
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_dir = self.base_dir / f"backup_{timestamp}"
             
-            if self.cubes_dir.exists() and any(self.cubes_dir.iterdir()):
-                backup_cubes = backup_dir / "cubes"
-                backup_cubes.mkdir(parents=True, exist_ok=True)
-                
-                for file in self.cubes_dir.glob("*.yml"):
-                    file.rename(backup_cubes / file.name)
-            
-            if self.views_dir.exists() and any(self.views_dir.iterdir()):
-                backup_views = backup_dir / "views"
-                backup_views.mkdir(parents=True, exist_ok=True)
-                
-                for file in self.views_dir.glob("*.yml"):
-                    file.rename(backup_views / file.name)
+            self._move_yml_files(self.cubes_dir, backup_dir / "cubes")
+            self._move_yml_files(self.views_dir, backup_dir / "views")
             
             if backup_dir.exists():
                 logger.info(f"Backed up existing files to: {backup_dir}")
@@ -404,7 +721,7 @@ def validate_cube_definition(cube_data: Dict[str, Any]) -> Tuple[bool, List[str]
     # Check name format
     if 'name' in cube_data:
         name = cube_data['name']
-        if not re.match(r'^[a-z][a-z0-9_]*$', name):
+        if not _NAME_RE.match(name):
             errors.append(f"Cube name '{name}' should start with lowercase letter and contain only letters, numbers, and underscores")
     
     # Check measures
@@ -425,6 +742,25 @@ def validate_cube_definition(cube_data: Dict[str, Any]) -> Tuple[bool, List[str]
     
     return len(errors) == 0, errors
 
+def is_valid_cube_definition(cube_data: Dict[str, Any]) -> bool:
+    """Check a cube definition, stopping at the first issue found"""
+    name = cube_data.get('name')
+    if name is None or not _NAME_RE.match(name):
+        return False
+    
+    if 'sql_table' not in cube_data and 'sql' not in cube_data:
+        return False
+    
+    for measure in cube_data.get('measures', ()):
+        if 'name' not in measure or 'type' not in measure:
+            return False
+    
+    for dimension in cube_data.get('dimensions', ()):
+        if 'name' not in dimension or 'sql' not in dimension:
+            return False
+    
+    return True
+
 def validate_view_definition(view_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate a view definition for common issues"""
     errors = []
@@ -440,7 +776,7 @@ def validate_view_definition(view_data: Dict[str, Any]) -> Tuple[bool, List[str]
     # Check name format
     if 'name' in view_data:
         name = view_data['name']
-        if not re.match(r'^[a-z][a-z0-9_]*$', name):
+        if not _NAME_RE.match(name):
             errors.append(f"View name '{name}' should start with lowercase letter and contain only letters, numbers, and underscores")
     
     return len(errors) == 0, errors
@@ -7,24 +7,34 @@ table classification, relationship detection, and domain-specific templates.
 """
 
 import os
+import re
 import sys
 import argparse
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import multiprocessing.util
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
+from dataclasses import dataclass, asdict
+from collections import defaultdict
+from types import MappingProxyType
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-import json
 
 # Import our custom modules
 from cubedev_config import (
-    DATABASE_CONFIGS, TABLE_CLASSIFICATION, COLUMN_TYPE_MAPPINGS,
+    DATABASE_CONFIGS,
     MEASURE_GENERATION_RULES, DIMENSION_GENERATION_RULES, 
     SEGMENT_GENERATION_RULES, PRE_AGGREGATION_CONFIG,
-    VIEW_GENERATION_CONFIG, DOMAIN_TEMPLATES
+    VIEW_GENERATION_CONFIG, DOMAIN_TEMPLATES,
+    NUMERIC_MEASURE_RULE_RE, SEGMENT_RULE_RE, DOMAIN_TABLE_RES
+)
+from cubedev_classify import (
+    ColumnView, map_sql_type_to_cube, build_column_view,
+    classify_table_name, classify_table_columns
 )
 from cubedev_utils import (
     CubeDevUtils, YAMLFormatter, DatabaseAnalyzer, 
-    FileManager, validate_cube_definition, validate_view_definition
+    FileManager, BackgroundWriter, FlowMapping, validate_cube_definition, validate_view_definition,
+    dumps_json
 )
 from postgres_to_cubedev import PostgreSQLIntrospector, DatabaseConfig, TableInfo
 
@@ -35,6 +45,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Join condition between a cube and the cube it references
+_JOIN_SQL_TMPL = "{{CUBE}}.{col} = {{{ref}.{ref_col}}}"
+
+# Pre-aggregation build range queries, bound once from configuration
+_BUILD_RANGE_START_SQL = PRE_AGGREGATION_CONFIG['time_ranges']['build_range_start'].format_map
+_BUILD_RANGE_END_SQL = PRE_AGGREGATION_CONFIG['time_ranges']['build_range_end'].format_map
+
+# Title-cased measure types for descriptions ("Sum of ..."), computed once per configured type
+_MEASURE_TYPE_TITLES = {
+    measure_type: measure_type.title()
+    for rule in MEASURE_GENERATION_RULES['numeric_measures'].values()
+    for measure_type in rule['measures']
+}
+
+# Time dimension granularities (written inline), and the columns that also get the custom ones
+_TIME_GRANULARITIES = tuple(map(FlowMapping, DIMENSION_GENERATION_RULES['time_dimensions']['granularities']))
+_TIME_CUSTOM_GRANULARITIES = tuple(DIMENSION_GENERATION_RULES['time_dimensions']['custom_granularities'])
+_CUSTOM_GRANULARITY_COLUMN_RE = re.compile(r'created_at|updated_at')
+
+# Shared read-only stand-in for cubes without generation metadata
+_NO_METADATA = MappingProxyType({})
+
+# Business metrics view: cubes always included, measure name terms that mark a
+# financial cube, and the cube limit (more cubes cause member name conflicts)
+_KEY_CUBE_NAMES = frozenset(['orders', 'order_items', 'order_payments'])
+_FINANCIAL_MEASURE_RE = re.compile(r'price|value|amount|cost')
+_MAX_BUSINESS_VIEW_CUBES = 3
+
+# Number of segment types a column scan can bind before it may stop early
+_SEGMENT_TYPE_COUNT = len(SEGMENT_GENERATION_RULES)
+
+# Per-table-type counter attribute on GenerationStats
+_TABLE_TYPE_STATS = {'fact': 'fact_tables', 'dimension': 'dimension_tables', 'junction': 'junction_tables'}
+
+@dataclass(slots=True)
+class GenerationStats:
+    """Counters accumulated over one generation run"""
+    cubes: int = 0
+    views: int = 0
+    fact_tables: int = 0
+    dimension_tables: int = 0
+    junction_tables: int = 0
+    errors: int = 0
+    
+    def count_cube(self, table_type: str) -> None:
+        """Count one generated cube and its table type"""
+        self.cubes += 1
+        attr = _TABLE_TYPE_STATS.get(table_type)
+        if attr:
+            setattr(self, attr, getattr(self, attr) + 1)
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain dict for summaries"""
+        return asdict(self)
+
 class EnhancedCubeGenerator:
     """Enhanced Cube.dev YAML generator with configuration-driven features"""
     
@@ -47,89 +112,32 @@ class EnhancedCubeGenerator:
         
         # Generated files tracking
         self.generated_files = []
-        self.generation_stats = {
-            'cubes': 0,
-            'views': 0,
-            'fact_tables': 0,
-            'dimension_tables': 0,
-            'junction_tables': 0,
-            'errors': 0
-        }
+        self.generation_stats = GenerationStats()
+        
+        # Tables reflected in bulk ahead of processing, consumed as each is processed
+        self._prefetched_tables: Dict[str, TableInfo] = {}
     
-    def classify_table_enhanced(self, table_info: TableInfo, sample_data: List[Dict] = None) -> str:
+    def _precompute_column_view(self, table_info: TableInfo) -> ColumnView:
+        """Lowercase, type-map and pattern-match every column exactly once"""
+        return build_column_view(table_info.columns, table_info.primary_keys, self._map_sql_type_to_cube)
+    
+    def classify_table_enhanced(self, table_info: TableInfo, sample_data: List[Dict] = None,
+                                view: ColumnView = None) -> str:
         """Enhanced table classification using configuration rules"""
         
-        table_name = table_info.name.lower()
-        
-        # Check name patterns first
-        fact_patterns = TABLE_CLASSIFICATION['fact_table_indicators']['name_patterns']
-        dim_patterns = TABLE_CLASSIFICATION['dimension_table_indicators']['name_patterns']
-        junction_patterns = TABLE_CLASSIFICATION['junction_table_indicators']['name_patterns']
-        
-        # Name-based classification
-        if any(pattern in table_name for pattern in fact_patterns):
-            return 'fact'
-        
-        if any(pattern in table_name for pattern in dim_patterns):
-            return 'dimension'
-            
-        if any(pattern in table_name for pattern in junction_patterns):
-            return 'junction'
+        # Name-based classification (check name patterns first)
+        table_type = classify_table_name(table_info.name)
+        if table_type:
+            return table_type
         
         # Column-based classification
-        fact_score = 0
-        dim_score = 0
-        
-        fact_col_patterns = TABLE_CLASSIFICATION['fact_table_indicators']['column_patterns']
-        dim_col_patterns = TABLE_CLASSIFICATION['dimension_table_indicators']['column_patterns']
-        
-        numeric_count = 0
-        text_count = 0
-        total_cols = len(table_info.columns)
+        if view is None:
+            view = self._precompute_column_view(table_info)
         
-        for col in table_info.columns:
-            col_name = col['name'].lower()
-            col_type = col['type'].lower()
-            
-            # Count column types
-            if any(t in col_type for t in ['int', 'decimal', 'numeric', 'float']):
-                numeric_count += 1
-            if any(t in col_type for t in ['varchar', 'text', 'char']):
-                text_count += 1
-            
-            # Score based on column patterns
-            if any(pattern in col_name for pattern in fact_col_patterns):
-                fact_score += 2
-            if any(pattern in col_name for pattern in dim_col_patterns):
-                dim_score += 2
-        
-        # Calculate ratios
-        numeric_ratio = numeric_count / total_cols if total_cols > 0 else 0
-        text_ratio = text_count / total_cols if total_cols > 0 else 0
-        fk_count = len(table_info.foreign_keys)
-        
-        # Apply classification rules
-        junction_threshold = TABLE_CLASSIFICATION['junction_table_indicators']
-        if (fk_count >= junction_threshold['foreign_key_threshold'] and 
-            total_cols <= junction_threshold['max_columns']):
-            return 'junction'
-        
-        fact_threshold = TABLE_CLASSIFICATION['fact_table_indicators']
-        if (fk_count >= fact_threshold['foreign_key_threshold'] and 
-            numeric_ratio >= fact_threshold['numeric_column_threshold']):
-            return 'fact'
-        
-        dim_threshold = TABLE_CLASSIFICATION['dimension_table_indicators']
-        if text_ratio >= dim_threshold['text_column_threshold']:
-            return 'dimension'
-        
-        # Default classification based on scores
-        if fact_score > dim_score:
-            return 'fact'
-        else:
-            return 'dimension'
+        return classify_table_columns(view, len(table_info.foreign_keys))
     
-    def generate_enhanced_measures(self, table_info: TableInfo, table_type: str) -> List[Dict[str, Any]]:
+    def generate_enhanced_measures(self, table_info: TableInfo, table_type: str,
+                                   view: ColumnView = None) -> List[Dict[str, Any]]:
         """Generate measures using configuration rules"""
         measures = []
         
@@ -152,26 +160,23 @@ class EnhancedCubeGenerator:
         
         # Generate numeric measures
         numeric_rules = MEASURE_GENERATION_RULES['numeric_measures']
-        
-        for col in table_info.columns:
-            col_name = col['name'].lower()
-            col_type = self._map_sql_type_to_cube(col['type'])
-            
-            if col_type == 'number' and col['name'] not in table_info.primary_keys:
-                # Find matching rule
-                matching_rule = None
-                for rule_name, rule_config in numeric_rules.items():
-                    if any(pattern in col_name for pattern in rule_config['patterns']):
-                        matching_rule = rule_config
-                        break
+        match_rule = NUMERIC_MEASURE_RULE_RE.match
+        if view is None:
+            view = self._precompute_column_view(table_info)
+        
+        for name, col_name, col_type, is_pk in zip(view.names, view.names_lower, view.cube_types, view.is_pk):
+            if col_type == 'number' and not is_pk:
+                # Find the first matching rule in a single scan
+                m = match_rule(col_name)
                 
-                if matching_rule:
+                if m:
+                    matching_rule = numeric_rules[m.lastgroup]
                     for measure_type in matching_rule['measures']:
                         measure = {
-                            'name': f"{measure_type}_{col['name']}",
-                            'sql': col['name'],
+                            'name': f"{measure_type}_{name}",
+                            'sql': name,
                             'type': measure_type,
-                            'description': f"{measure_type.title()} of {col['name']}"
+                            'description': f"{_MEASURE_TYPE_TITLES[measure_type]} of {name}"
                         }
                         
                         if 'format' in matching_rule:
@@ -181,63 +186,76 @@ class EnhancedCubeGenerator:
         
         return measures
     
-    def generate_enhanced_dimensions(self, table_info: TableInfo) -> List[Dict[str, Any]]:
+    def generate_enhanced_dimensions(self, table_info: TableInfo, view: ColumnView = None) -> List[Dict[str, Any]]:
         """Generate dimensions using configuration rules"""
         dimensions = []
+        if view is None:
+            view = self._precompute_column_view(table_info)
         
-        for col in table_info.columns:
-            col_name = col['name'].lower()
-            cube_type = self._map_sql_type_to_cube(col['type'])
-            
+        for name, col_name, cube_type, is_pk in zip(view.names, view.names_lower, view.cube_types, view.is_pk):
             dimension = {
-                'name': col['name'],
-                'sql': col['name'],
+                'name': name,
+                'sql': name,
                 'type': cube_type,
-                'description': self.utils.generate_description(col['name'], 'dimension')
+                'description': self.utils.generate_description(name, 'dimension')
             }
             
             # Mark primary key
-            if col['name'] in table_info.primary_keys:
+            if is_pk:
                 dimension['primary_key'] = True
             
             # Add time dimension granularities
             if cube_type == 'time':
-                time_config = DIMENSION_GENERATION_RULES['time_dimensions']
-                
-                # Add standard granularities
-                dimension['granularities'] = time_config['granularities'].copy()
-                
-                # Add custom granularities for specific columns
-                if any(pattern in col_name for pattern in ['created_at', 'updated_at']):
-                    dimension['granularities'].extend(time_config['custom_granularities'])
+                dimension['granularities'] = self._time_granularities(col_name)
             
             dimensions.append(dimension)
         
         return dimensions
     
-    def generate_enhanced_segments(self, table_info: TableInfo) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _time_granularities(col_name: str) -> List[Dict[str, Any]]:
+        """Granularities for a time dimension, as a fresh list of the shared granularity dicts"""
+        # Add custom granularities for specific columns
+        if _CUSTOM_GRANULARITY_COLUMN_RE.search(col_name):
+            return [*_TIME_GRANULARITIES, *_TIME_CUSTOM_GRANULARITIES]
+        return list(_TIME_GRANULARITIES)
+    
+    def generate_enhanced_segments(self, table_info: TableInfo, view: ColumnView = None) -> List[Dict[str, Any]]:
         """Generate segments using configuration rules"""
-        segments = []
+        if view is None:
+            view = self._precompute_column_view(table_info)
+        
+        # One scan per column finds every segment type it matches; later columns
+        # of a type would only produce duplicates, so each type binds to its first column
+        first_columns = {}
+        match_rules = SEGMENT_RULE_RE.match
+        for name, col_name in zip(view.names, view.names_lower):
+            for segment_type, hit in match_rules(col_name).groupdict().items():
+                if hit is not None and segment_type not in first_columns:
+                    first_columns[segment_type] = name
+            if len(first_columns) == _SEGMENT_TYPE_COUNT:
+                # Every segment type is bound; the remaining columns cannot add anything
+                break
         
+        # Segments keyed by name; the first template to claim a name wins
+        segments: Dict[str, Dict[str, Any]] = {}
         for segment_type, config in SEGMENT_GENERATION_RULES.items():
-            for col in table_info.columns:
-                col_name = col['name'].lower()
-                
-                if any(pattern in col_name for pattern in config['patterns']):
-                    for segment_template in config['segments']:
-                        segment = {
-                            'name': segment_template['name'],
-                            'sql': f"{{CUBE}}.{col['name']} {segment_template['condition']}",
-                            'description': segment_template['description']
-                        }
-                        
-                        # Avoid duplicates
-                        if not any(s['name'] == segment['name'] for s in segments):
-                            segments.append(segment)
+            name = first_columns.get(segment_type)
+            if name is None:
+                continue
+            
+            for segment_template in config['segments']:
+                if segment_template['name'] not in segments:
+                    segments[segment_template['name']] = {
+                        'name': segment_template['name'],
+                        'sql': f"{{CUBE}}.{name} {segment_template['condition']}",
+                        'description': segment_template['description']
+                    }
         
-        return segments
+        return list(segments.values())
     
-    def generate_enhanced_pre_aggregations(self, table_info: TableInfo, table_type: str) -> List[Dict[str, Any]]:
+    def generate_enhanced_pre_aggregations(self, table_info: TableInfo, table_type: str,
+                                           view: ColumnView = None) -> List[Dict[str, Any]]:
         """Generate pre-aggregations using configuration rules"""
         pre_aggs = []
         
@@ -245,13 +263,11 @@ class EnhancedCubeGenerator:
             return pre_aggs
         
         config = PRE_AGGREGATION_CONFIG['fact_tables']
+        if view is None:
+            view = self._precompute_column_view(table_info)
         
         # Find time dimension
-        time_dimension = None
-        for col in table_info.columns:
-            if self._map_sql_type_to_cube(col['type']) == 'time':
-                time_dimension = col['name']
-                break
+        time_dimension = view.time_dim_names[0] if view.time_dim_names else None
         
         if not time_dimension:
             return pre_aggs
@@ -260,10 +276,9 @@ class EnhancedCubeGenerator:
         suitable_dimensions = []
         preferred_patterns = config['preferred_dimensions']
         
-        for col in table_info.columns:
-            col_name = col['name'].lower()
+        for name, col_name in zip(view.names, view.names_lower):
             if any(pattern in col_name for pattern in preferred_patterns):
-                suitable_dimensions.append(col['name'])
+                suitable_dimensions.append(name)
         
         # Limit dimensions
         suitable_dimensions = suitable_dimensions[:config['max_dimensions']]
@@ -284,18 +299,12 @@ class EnhancedCubeGenerator:
             pre_agg['dimensions'] = suitable_dimensions
         
         # Add build range
-        time_range_config = PRE_AGGREGATION_CONFIG['time_ranges']
+        range_params = {'time_column': time_dimension, 'table': table_info.qualified_name}
         pre_agg['build_range_start'] = {
-            'sql': time_range_config['build_range_start'].format(
-                time_column=time_dimension,
-                table=f"{table_info.schema}.{table_info.name}"
-            )
+            'sql': _BUILD_RANGE_START_SQL(range_params)
         }
         pre_agg['build_range_end'] = {
-            'sql': time_range_config['build_range_end'].format(
-                time_column=time_dimension,
-                table=f"{table_info.schema}.{table_info.name}"
-            )
+            'sql': _BUILD_RANGE_END_SQL(range_params)
         }
         
         pre_aggs.append(pre_agg)
@@ -304,50 +313,79 @@ class EnhancedCubeGenerator:
     def generate_enhanced_cube(self, table_info: TableInfo, sample_data: List[Dict] = None) -> Dict[str, Any]:
         """Generate enhanced cube with all features"""
         
+        # Walk the columns once and share the result with every generator
+        view = self._precompute_column_view(table_info)
+        
         # Classify table
-        table_type = self.classify_table_enhanced(table_info, sample_data)
+        table_type = self.classify_table_enhanced(table_info, sample_data, view)
         
-        # Base cube structure
+        # Generate components
+        measures = self.generate_enhanced_measures(table_info, table_type, view)
+        dimensions = self.generate_enhanced_dimensions(table_info, view)
+        segments = self.generate_enhanced_segments(table_info, view)
+        joins = self._generate_joins(table_info)
+        
+        # Pre-aggregations only apply to fact tables
+        pre_aggs = self.generate_enhanced_pre_aggregations(table_info, table_type, view) if table_type == 'fact' else None
+        
+        # Assemble the cube in one pass, keeping only non-empty sections in output order
+        qualified_name = table_info.qualified_name
         cube = {
             'name': self.utils.sanitize_name(table_info.name),
-            'sql_table': f"{table_info.schema}.{table_info.name}",
+            'sql_table': qualified_name,
             'description': self.utils.generate_description(table_info.name, 'cube')
         }
-        
-        # Generate components
-        measures = self.generate_enhanced_measures(table_info, table_type)
-        dimensions = self.generate_enhanced_dimensions(table_info)
-        segments = self.generate_enhanced_segments(table_info)
-        
-        if measures:
-            cube['measures'] = measures
-        if dimensions:
-            cube['dimensions'] = dimensions
-        if segments:
-            cube['segments'] = segments
-        
-        # Generate joins
-        joins = self._generate_joins(table_info)
-        if joins:
-            cube['joins'] = joins
-        
-        # Generate pre-aggregations for fact tables
-        if table_type == 'fact':
-            pre_aggs = self.generate_enhanced_pre_aggregations(table_info, table_type)
-            if pre_aggs:
-                cube['pre_aggregations'] = pre_aggs
+        cube.update((key, section) for key, section in (
+            ('measures', measures),
+            ('dimensions', dimensions),
+            ('segments', segments),
+            ('joins', joins),
+            ('pre_aggregations', pre_aggs)
+        ) if section)
         
         # Add metadata
         cube['_metadata'] = {
             'table_type': table_type,
-            'source_table': f"{table_info.schema}.{table_info.name}",
+            'source_table': qualified_name,
             'column_count': len(table_info.columns),
-            'foreign_key_count': len(table_info.foreign_keys)
+            'foreign_key_count': len(table_info.foreign_keys),
+            'time_dimensions': view.time_dim_names
         }
         
         return cube
     
-    def generate_domain_specific_views(self, cubes: List[Dict[str, Any]], domain: str = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def summarize_cube(cube: Dict[str, Any]) -> Dict[str, Any]:
+        """The parts of a cube that view generation reads, in the cube's own shape"""
+        # Held for every table until views are built, so drop descriptions, SQL and dimensions
+        metadata = cube.get('_metadata', _NO_METADATA)
+        time_dimensions = metadata.get('time_dimensions')
+        if time_dimensions is None:
+            time_dimensions = [
+                dimension['name'] for dimension in cube.get('dimensions', [])
+                if dimension.get('type') == 'time'
+            ]
+        
+        summary = {
+            'name': cube['name'],
+            'measures': [{'name': measure['name']} for measure in cube.get('measures', [])],
+            'joins': [{'name': join['name']} for join in cube.get('joins', [])],
+            '_metadata': {'time_dimensions': time_dimensions}
+        }
+        if 'table_type' in metadata:
+            summary['_metadata']['table_type'] = metadata['table_type']
+        return summary
+    
+    @staticmethod
+    def partition_cubes_by_type(cubes: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group cubes by their table type in a single pass"""
+        cubes_by_type = defaultdict(list)
+        for cube in cubes:
+            cubes_by_type[cube.get('_metadata', _NO_METADATA).get('table_type')].append(cube)
+        return cubes_by_type
+    
+    def generate_domain_specific_views(self, cubes: List[Dict[str, Any]], domain: str = None,
+                                       cubes_by_type: Dict[str, List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """Generate domain-specific views"""
         views = []
         
@@ -355,19 +393,23 @@ class EnhancedCubeGenerator:
         if not domain:
             domain = self._detect_domain(cubes)
         
+        # Partition by table type once, unless the caller already did while generating
+        if cubes_by_type is None:
+            cubes_by_type = self.partition_cubes_by_type(cubes)
+        
         # Generate business metrics view
         business_view = self._generate_business_metrics_view(cubes)
         if business_view:
             views.append(business_view)
         
         # Generate fact analysis view
-        fact_cubes = [cube for cube in cubes if cube.get('_metadata', {}).get('table_type') == 'fact']
+        fact_cubes = cubes_by_type.get('fact')
         if fact_cubes:
             fact_view = self._generate_fact_analysis_view(fact_cubes)
             views.append(fact_view)
         
         # Generate dimension catalog view
-        dim_cubes = [cube for cube in cubes if cube.get('_metadata', {}).get('table_type') == 'dimension']
+        dim_cubes = cubes_by_type.get('dimension')
         if dim_cubes:
             dim_view = self._generate_dimension_catalog_view(dim_cubes)
             views.append(dim_view)
@@ -376,24 +418,26 @@ class EnhancedCubeGenerator:
     
     def _map_sql_type_to_cube(self, sql_type: str) -> str:
         """Map SQL type to Cube.dev type using configuration"""
-        sql_type_lower = sql_type.lower()
-        base_type = sql_type_lower.split('(')[0]
-        return COLUMN_TYPE_MAPPINGS.get(base_type, 'string')
+        return map_sql_type_to_cube(sql_type)
     
     def _generate_joins(self, table_info: TableInfo) -> List[Dict[str, Any]]:
         """Generate join definitions"""
         joins = []
+        sanitize_name = self.utils.sanitize_name
+        determine_join_relationship = self.utils.determine_join_relationship
+        join_sql = _JOIN_SQL_TMPL.format
         
         for fk in table_info.foreign_keys:
             if fk['constrained_columns'] and fk['referred_table']:
+                ref = sanitize_name(fk['referred_table'])
                 join = {
-                    'name': self.utils.sanitize_name(fk['referred_table']),
-                    'relationship': self.utils.determine_join_relationship(
+                    'name': ref,
+                    'relationship': determine_join_relationship(
                         table_info.name, 
                         fk['referred_table'], 
                         fk['constrained_columns']
                     ),
-                    'sql': f"{{CUBE}}.{fk['constrained_columns'][0]} = {{{self.utils.sanitize_name(fk['referred_table'])}.{fk['referred_columns'][0]}}}"
+                    'sql': join_sql(col=fk['constrained_columns'][0], ref=ref, ref_col=fk['referred_columns'][0])
                 }
                 joins.append(join)
         
@@ -401,19 +445,12 @@ class EnhancedCubeGenerator:
     
     def _detect_domain(self, cubes: List[Dict[str, Any]]) -> str:
         """Detect domain based on cube names and patterns"""
-        cube_names = [cube['name'].lower() for cube in cubes]
+        # Newline-joined so a pattern can never match across two cube names
+        cube_name_blob = '\n'.join(cube['name'].lower() for cube in cubes)
         
-        for domain, config in DOMAIN_TEMPLATES.items():
-            if domain == 'generic':
-                continue
-                
-            # Check for domain-specific table patterns
-            fact_matches = sum(1 for table in config['fact_tables'] 
-                             if any(table in name for name in cube_names))
-            dim_matches = sum(1 for table in config['dimension_tables'] 
-                            if any(table in name for name in cube_names))
-            
-            total_matches = fact_matches + dim_matches
+        for domain, table_re in DOMAIN_TABLE_RES.items():
+            # Count the domain's table patterns present in any cube name, in one regex call
+            total_matches = sum(1 for hit in table_re.match(cube_name_blob).groups() if hit is not None)
             if total_matches >= 2:  # At least 2 matches to consider domain
                 logger.info(f"Detected domain: {domain}")
                 return domain
@@ -424,20 +461,20 @@ class EnhancedCubeGenerator:
         """Generate business metrics view with proper Cube.dev syntax"""
         config = VIEW_GENERATION_CONFIG['business_metrics_view']
         
-        # Select key cubes for business metrics
+        # Select key cubes for business metrics; only the first few are used, so stop there
         key_cubes = []
+        financial_search = _FINANCIAL_MEASURE_RE.search
         for cube in cubes:
             cube_name = cube['name']
+            measures = cube.get('measures', ())
             # Include cubes that have meaningful measures (not just dimension tables)
-            has_financial_measures = any(
-                any(term in measure['name'] for term in ['price', 'value', 'amount', 'cost'])
-                for measure in cube.get('measures', [])
-            )
-            has_multiple_measures = len(cube.get('measures', [])) > 2  # More than just count/count_distinct
-            
-            if has_financial_measures or has_multiple_measures or cube_name in ['orders', 'order_items', 'order_payments']:
+            if (len(measures) > 2  # More than just count/count_distinct
+                    or cube_name in _KEY_CUBE_NAMES
+                    or any(financial_search(measure['name']) for measure in measures)):
                 key_cubes.append(cube_name)
-
+                if len(key_cubes) == _MAX_BUSINESS_VIEW_CUBES:
+                    break
+        
         if not key_cubes:
             return None
             
@@ -449,7 +486,7 @@ class EnhancedCubeGenerator:
         }
         
         # Add cubes with proper join_path, includes, and prefix to avoid conflicts
-        for cube_name in key_cubes[:3]:  # Limit to 3 cubes to avoid conflicts
+        for cube_name in key_cubes:
             view['cubes'].append({
                 'join_path': cube_name,
                 'includes': '*',
@@ -469,20 +506,27 @@ class EnhancedCubeGenerator:
         }
         
         for cube in fact_cubes:
+            includes = ['count', 'count_distinct']
+            included = set(includes)
             cube_config = {
                 'join_path': cube['name'],
-                'includes': ['count', 'count_distinct']
+                'includes': includes
             }
             
             # Add all measures from fact tables
             for measure in cube.get('measures', []):
-                if measure['name'] not in cube_config['includes']:
-                    cube_config['includes'].append(measure['name'])
+                if measure['name'] not in included:
+                    included.add(measure['name'])
+                    includes.append(measure['name'])
             
-            # Add time dimensions
-            for dimension in cube.get('dimensions', []):
-                if dimension.get('type') == 'time':
-                    cube_config['includes'].append(dimension['name'])
+            # Add time dimensions, recorded at generation time when available
+            time_dimensions = cube.get('_metadata', _NO_METADATA).get('time_dimensions')
+            if time_dimensions is None:
+                time_dimensions = [
+                    dimension['name'] for dimension in cube.get('dimensions', [])
+                    if dimension.get('type') == 'time'
+                ]
+            includes.extend(time_dimensions)
             
             view['cubes'].append(cube_config)
             
@@ -527,7 +571,130 @@ class EnhancedCubeGenerator:
         
         return view
     
-    def process_database(self, introspector: PostgreSQLIntrospector, tables: List[str] = None) -> Dict[str, Any]:
+    def _generate_cube_for_table(self, table_info: TableInfo) -> Dict[str, Any]:
+        """Generate one table's cube for process_database"""
+        return self.generate_enhanced_cube(table_info)
+    
+    def _worker_factory(self) -> Callable[[str, str], 'EnhancedCubeGenerator']:
+        """Build the generator each worker process uses, from (output_dir, config_profile)"""
+        return type(self)
+    
+    def _generate_table_cube(self, introspector: PostgreSQLIntrospector, table_name: str) -> Tuple[Dict[str, Any], List[str]]:
+        """Introspect, generate and validate the cube for a single table"""
+        logger.info("Processing table: %s", table_name)
+        
+        # Introspect table
+        table_info = self._prefetched_tables.pop(table_name, None)
+        if table_info is None:
+            table_info = introspector.introspect_table(table_name)
+        
+        # Generate cube (classification is schema-only, so no sample rows are fetched)
+        cube = self._generate_cube_for_table(table_info)
+        
+        # Validate cube
+        is_valid, validation_errors = validate_cube_definition(cube)
+        if not is_valid:
+            logger.warning("Validation errors for %s: %s", table_name, validation_errors)
+        
+        return cube, validation_errors
+    
+    def _prefetch_tables(self, introspector: PostgreSQLIntrospector, tables: List[str],
+                         use_cache: bool = False, refresh_cache: bool = False) -> None:
+        """Reflect all tables in a few batched queries instead of several round trips per table"""
+        cached: Dict[str, TableInfo] = {}
+        stored: Dict[str, Any] = {}
+        cache_key = fingerprints = None
+        pruned = False
+        
+        if use_cache:
+            # Reuse each table's result from an earlier run while its catalog rows are unchanged
+            cache_key = introspector.cache_key()
+            fingerprints = introspector.get_table_fingerprints()
+            data = None if refresh_cache or fingerprints is None else self.file_manager.load_introspection_cache(cache_key)
+            if data:
+                try:
+                    # Drop entries for tables that changed or no longer exist
+                    stored = {
+                        name: entry for name, entry in data['tables'].items()
+                        if entry['fingerprint'] == fingerprints.get(name)
+                    }
+                    cached = {name: TableInfo(**stored[name]['info']) for name in tables if name in stored}
+                    pruned = len(stored) < len(data['tables'])
+                except (TypeError, KeyError, AttributeError) as e:
+                    logger.warning(f"Ignoring unreadable introspection cache: {e}")
+                    cached, stored, pruned = {}, {}, True
+                logger.info(f"Introspection cache: {len(cached)} hits, {len(tables) - len(cached)} misses")
+        
+        missing = [table_name for table_name in tables if table_name not in cached]
+        try:
+            self._prefetched_tables = {**cached, **introspector.introspect_all(missing)} if missing else cached
+        except Exception as e:
+            logger.warning(f"Batch introspection failed, introspecting tables one by one: {e}")
+            self._prefetched_tables = cached
+            return
+        
+        if fingerprints is not None and (missing or pruned):
+            # Entries for tables outside this run are kept so a later full run still hits
+            stored.update(
+                (name, {'fingerprint': fingerprints[name], 'info': asdict(self._prefetched_tables[name])})
+                for name in missing if name in self._prefetched_tables and name in fingerprints
+            )
+            try:
+                self.file_manager.save_introspection_cache(cache_key, {'tables': stored})
+            except Exception as e:
+                logger.warning(f"Could not save introspection cache: {e}")
+    
+    def _process_table(self, introspector: PostgreSQLIntrospector, table_name: str) -> Tuple[Dict[str, Any], str, List[str]]:
+        """Generate, validate and save the cube for a single table, returning its summary"""
+        cube, validation_errors = self._generate_table_cube(introspector, table_name)
+        filepath = self.file_manager.save_cube_file(cube)
+        
+        return self.summarize_cube(cube), filepath, validation_errors
+    
+    def _iter_table_results(self, introspector: PostgreSQLIntrospector, tables: List[str],
+                            max_workers: int, use_threads: bool,
+                            writer: BackgroundWriter) -> Iterator[Tuple[str, Any]]:
+        """Yield (table_name, (cube summary, filepath, errors) or exception) for each table, in input order"""
+        if max_workers <= 1 or len(tables) <= 1:
+            # Saves drain on the writer thread while the next table is generated
+            for table_name in tables:
+                try:
+                    cube, validation_errors = self._generate_table_cube(introspector, table_name)
+                    yield table_name, (self.summarize_cube(cube), writer.submit(self.file_manager.save_cube_file, cube),
+                                       validation_errors)
+                except Exception as e:
+                    yield table_name, e
+            return
+        
+        if use_threads:
+            # The engine's connection pool is shared across threads
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            submit = lambda name: executor.submit(self._process_table, introspector, name)
+        else:
+            # Engines are not picklable, so each worker process opens its own; prefetched
+            # TableInfo records are sent along so workers only introspect tables the batch missed
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_table_worker,
+                initargs=(self._worker_factory(), introspector.config, self.output_dir, self.config_profile)
+            )
+            prefetched = self._prefetched_tables
+            submit = lambda name: executor.submit(_process_table_in_worker, name, prefetched.pop(name, None))
+        
+        with executor:
+            futures = {submit(table_name): index for index, table_name in enumerate(tables)}
+            results: List[Any] = [None] * len(tables)
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+        
+        yield from zip(tables, results)
+    
+    def process_database(self, introspector: PostgreSQLIntrospector, tables: List[str] = None,
+                         max_workers: int = 1, use_threads: bool = False,
+                         use_cache: bool = False, refresh_cache: bool = False) -> Dict[str, Any]:
         """Process entire database and generate all YAML files"""
         
         logger.info("Starting enhanced database processing...")
@@ -539,69 +706,68 @@ class EnhancedCubeGenerator:
         logger.info(f"Processing {len(tables)} tables...")
         
         cubes = []
+        cubes_by_type = defaultdict(list)
         errors = []
         
-        # Process each table
-        for table_name in tables:
-            try:
-                logger.info(f"Processing table: {table_name}")
-                
-                # Introspect table
-                table_info = introspector.introspect_table(table_name)
-                
-                # Get sample data for analysis
-                sample_data = introspector.get_sample_data(table_name)
-                
-                # Generate cube
-                cube = self.generate_enhanced_cube(table_info, sample_data)
-                
-                # Validate cube
-                is_valid, validation_errors = validate_cube_definition(cube)
-                if not is_valid:
-                    logger.warning(f"Validation errors for {table_name}: {validation_errors}")
-                    errors.extend(validation_errors)
-                
-                # Save cube
-                filepath = self.file_manager.save_cube_file(cube)
-                self.generated_files.append(filepath)
-                cubes.append(cube)
-                
-                # Update stats
-                table_type = cube.get('_metadata', {}).get('table_type', 'unknown')
-                self.generation_stats['cubes'] += 1
-                self.generation_stats[f'{table_type}_tables'] = self.generation_stats.get(f'{table_type}_tables', 0) + 1
-                
-                logger.info(f"Generated cube for {table_name} (type: {table_type})")
-                
-            except Exception as e:
-                logger.error(f"Error processing table {table_name}: {e}")
-                errors.append(f"Table {table_name}: {str(e)}")
-                self.generation_stats['errors'] += 1
+        # Reflect (or load from the cache) every table here; worker processes receive their TableInfo
+        self._prefetch_tables(introspector, tables, use_cache, refresh_cache)
+        
+        # Process each table (optionally in parallel); cube files are written behind generation
+        # and only their summaries are kept, so memory does not grow with whole cubes
+        with BackgroundWriter() as writer:
+            pending = list(self._iter_table_results(introspector, tables, max_workers, use_threads, writer))
+        self._prefetched_tables = {}
+        
+        # Reduce results here, in table order, once all writes have drained
+        for table_name, result in pending:
+            if not isinstance(result, Exception):
+                cube, filepath, validation_errors = result
+                if isinstance(filepath, Future):
+                    try:
+                        filepath = filepath.result()
+                    except Exception as e:
+                        result = e
+            
+            if isinstance(result, Exception):
+                logger.error(f"Error processing table {table_name}: {result}")
+                errors.append(f"Table {table_name}: {str(result)}")
+                self.generation_stats.errors += 1
                 continue
+            
+            errors.extend(validation_errors)
+            self.generated_files.append(filepath)
+            cubes.append(cube)
+            
+            # Update stats
+            table_type = cube.get('_metadata', _NO_METADATA).get('table_type', 'unknown')
+            cubes_by_type[table_type].append(cube)
+            self.generation_stats.count_cube(table_type)
+            
+            logger.info("Generated cube for %s (type: %s)", table_name, table_type)
         
         # Generate views
         logger.info("Generating views...")
-        views = self.generate_domain_specific_views(cubes)
+        views = self.generate_domain_specific_views(cubes, cubes_by_type=cubes_by_type)
         
         for view in views:
             try:
                 # Validate view
                 is_valid, validation_errors = validate_view_definition(view)
                 if not is_valid:
-                    logger.warning(f"View validation errors: {validation_errors}")
+                    logger.warning("View validation errors: %s", validation_errors)
                     errors.extend(validation_errors)
                 
                 # Save view
                 filepath = self.file_manager.save_view_file(view)
                 self.generated_files.append(filepath)
-                self.generation_stats['views'] += 1
+                self.generation_stats.views += 1
                 
-                logger.info(f"Generated view: {view['name']}")
+                logger.info("Generated view: %s", view['name'])
                 
             except Exception as e:
                 logger.error(f"Error generating view {view.get('name', 'unknown')}: {e}")
                 errors.append(f"View {view.get('name', 'unknown')}: {str(e)}")
-                self.generation_stats['errors'] += 1
+                self.generation_stats.errors += 1
         
         # Create index file
         index_file = self.file_manager.create_index_file(self.generated_files)
@@ -609,17 +775,49 @@ class EnhancedCubeGenerator:
         # Generate summary
         summary = {
             'total_files': len(self.generated_files),
-            'stats': self.generation_stats,
+            'stats': self.generation_stats.to_dict(),
             'errors': errors,
             'output_directory': self.output_dir,
             'generated_files': self.generated_files,
             'index_file': index_file
         }
         
-        logger.info(f"Generation complete! Summary: {json.dumps(self.generation_stats, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generation complete! Summary: %s", dumps_json(self.generation_stats.to_dict(), indent=True).decode())
         
         return summary
 
+# Per-process state for ProcessPoolExecutor workers
+_worker_state: Dict[str, Any] = {}
+
+def _init_table_worker(generator_factory: Callable[[str, str], EnhancedCubeGenerator], db_config: DatabaseConfig,
+                       output_dir: str, config_profile: str) -> None:
+    """Open a database connection and a generator once per worker process"""
+    introspector = PostgreSQLIntrospector(db_config)
+    if not introspector.connect():
+        raise RuntimeError("Worker failed to connect to database")
+    
+    # Each worker queries from a single thread, so it keeps one connection for its lifetime.
+    # multiprocessing runs its Finalize callbacks as a worker exits, including forked workers,
+    # which skip atexit handlers
+    introspector.__enter__()
+    multiprocessing.util.Finalize(introspector, _close_worker_introspector, args=(introspector,), exitpriority=10)
+    
+    _worker_state['introspector'] = introspector
+    _worker_state['generator'] = generator_factory(output_dir, config_profile)
+
+def _close_worker_introspector(introspector: PostgreSQLIntrospector) -> None:
+    """Release a worker's held connection and its engine's pool"""
+    introspector.__exit__(None, None, None)
+    introspector.engine.dispose()
+
+def _process_table_in_worker(table_name: str, table_info: Optional[TableInfo] = None) -> Tuple[Dict[str, Any], str, List[str]]:
+    """Process one table inside a worker process, from its prefetched TableInfo when given"""
+    generator = _worker_state['generator']
+    if table_info is not None:
+        generator._prefetched_tables[table_name] = table_info
+    return generator._process_table(_worker_state['introspector'], table_name)
+
 def main():
     """Enhanced main function with additional features"""
     parser = argparse.ArgumentParser(
@@ -644,7 +842,7 @@ Examples:
     parser.add_argument("--port", type=int, default=5432, help="PostgreSQL port")
     parser.add_argument("--database", help="Database name")
     parser.add_argument("--username", help="Database username")
-    parser.add_argument("--password", help="Database password")
+    parser.add_argument("--password", help="Database password (default: PGPASSWORD or ~/.pgpass)")
     parser.add_argument("--schema", default="public", help="Database schema")
     
     # Configuration arguments
@@ -659,6 +857,14 @@ Examples:
                        help="Domain for specialized templates")
     parser.add_argument("--backup-existing", action="store_true", 
                        help="Backup existing files before generation")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Number of tables to process in parallel (default: 1)")
+    parser.add_argument("--use-threads", action="store_true",
+                       help="Parallelize with threads instead of processes (for I/O-bound databases)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Do not reuse or store introspection results in <output-dir>/.cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                       help="Re-introspect all tables and overwrite the introspection cache")
     
     # Output options
     parser.add_argument("--validate-output", action="store_true", 
@@ -684,7 +890,7 @@ Examples:
         )
     else:
         # Require individual parameters
-        if not all([args.host, args.database, args.username, args.password]):
+        if not all([args.host, args.database, args.username]):
             parser.error("Database connection parameters are required")
         
         db_config = DatabaseConfig(
@@ -696,8 +902,9 @@ Examples:
             schema=args.schema
         )
     
-    # Initialize components
-    introspector = PostgreSQLIntrospector(db_config)
+    # Initialize components (thread workers share one engine, so give each a pooled connection)
+    pool_size = max(5, args.workers) if args.use_threads else 5
+    introspector = PostgreSQLIntrospector(db_config, pool_size=pool_size)
     
     if not introspector.connect():
         logger.error("Failed to connect to database")
@@ -711,7 +918,11 @@ Examples:
     
     # Process database
     try:
-        summary = generator.process_database(introspector, args.tables)
+        # This thread's queries share one held connection for the whole run
+        with introspector:
+            summary = generator.process_database(introspector, args.tables,
+                                                 max_workers=args.workers, use_threads=args.use_threads,
+                                                 use_cache=not args.no_cache, refresh_cache=args.refresh_cache)
         
         # Print summary
         print("\n" + "="*50)
@@ -743,8 +954,7 @@ Examples:
         # Generate detailed summary if requested
         if args.generate_summary:
             summary_file = Path(args.output_dir) / "generation_summary.json"
-            with open(summary_file, 'w') as f:
-                json.dump(summary, f, indent=2)
+            summary_file.write_bytes(dumps_json(summary, indent=True))
             print(f"Detailed summary saved to: {summary_file}")
         
     except Exception as e:
@@ -7,19 +7,201 @@ measures, and dimensions based on database schema and sample data.
 """
 
 import os
+import re
+import time
+import importlib.util
+import random
 import logging
-from typing import Dict, List, Any, Optional
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+# Only for DescriptionCache.make_key, whose stdlib formatting keeps cache keys stable across runs
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from cubedev_utils import dumps_json, loads_json
+from cubedev_config import CURRENCY_COLUMN_RE
+
+# openai is slow to import, so it is only loaded once an LLM generator is enabled
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeout and retry policy (jittered exponential backoff, in seconds)
+LLM_REQUEST_TIMEOUT = 120.0
+LLM_MAX_ATTEMPTS = 5
+LLM_BACKOFF_BASE = 2.0
+LLM_BACKOFF_MAX = 60.0
+
+# Deterministic sampling, so a cached description is the one a fresh request would return
+LLM_TEMPERATURE = 0.0
+
+# Completion budgets for one-line attribute descriptions (about 10 and 15 words), cut at the first newline
+DIMENSION_MAX_TOKENS = 25
+MEASURE_MAX_TOKENS = 35
+ATTRIBUTE_STOP = ["\n"]
+
+# Sample rows shown in table prompts, with long values cut to save prompt tokens
+SAMPLE_PREVIEW_ROWS = 2
+SAMPLE_VALUE_MAX_CHARS = 80
+
+# Fixed descriptions for measures whose LLM text would not vary meaningfully
+TRIVIAL_MEASURE_TEMPLATES = MappingProxyType({
+    'count': "Total number of {table} records",
+    'count_distinct': "Number of distinct {column} values",
+    'min': "Smallest {column}",
+    'max': "Largest {column}",
+})
+
+# Fixed descriptions for sums and averages of currency columns
+CURRENCY_MEASURE_TEMPLATES = MappingProxyType({
+    'sum': "Total {column} in monetary units",
+    'avg': "Average {column} per {table} record",
+})
+
+# With the "cheap" tier these get template descriptions instead of LLM requests
+LLM_TIERS = ('full', 'cheap')
+# Per-attribute prompts open with their static instructions, then run-, table- and column-level
+# context, so requests share the longest possible prefix for OpenAI's automatic prompt caching
+_DIMENSION_SYSTEM_PROMPT = "You are a data analyst expert. Generate concise descriptions for database columns/dimensions. Keep it under 10 words."
+_DIMENSION_PROMPT_PREFIX = """Generate a concise description for a database column used as a dimension.
+Describe what the column represents in business terms. Keep it under 10 words.
+Examples:
+- customer_id → "Unique customer identifier"
+- order_date → "Date when order was placed"
+- product_category → "Product classification category"
+"""
+_MEASURE_SYSTEM_PROMPT = "You are a data analyst expert. Generate concise descriptions for business metrics/measures. Keep it under 15 words."
+_MEASURE_PROMPT_PREFIX = """Generate a concise description for a business metric/measure.
+Describe what the metric measures in business terms. Keep it under 15 words.
+Examples:
+- sum_amount → "Total monetary value of all transactions"
+- avg_price → "Average price across all products"
+- count_orders → "Total number of orders placed"
+"""
+
+_TRIVIAL_DIMENSION_RE = re.compile(r'^id$|_id$|^(created|updated|deleted)_at$')
+
+@lru_cache(maxsize=8192)
+def _pretty(name: str) -> str:
+    """Title-cased display form of a snake_case name (memoized; names recur across a schema)"""
+    return name.replace('_', ' ').title()
+
+class RateLimiter:
+    """Token bucket for requests and tokens per minute, shared by all threads (0 disables a limit)"""
+    
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until one request of about `tokens` tokens fits in both budgets"""
+        if not self.rpm and not self.tpm:
+            return
+        
+        # A request larger than the whole bucket would otherwise never fit
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        
+        while True:
+            with self._lock:
+                # Refill both buckets for the time since the last call
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+                if self.rpm:
+                    self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+                if self.tpm:
+                    self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+                
+                wait = 0.0
+                if self.rpm and self._requests < 1:
+                    wait = (1 - self._requests) * 60 / self.rpm
+                if self.tpm and self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+                
+                if wait <= 0:
+                    if self.rpm:
+                        self._requests -= 1
+                    if self.tpm:
+                        self._tokens -= tokens
+                    return
+            
+            time.sleep(wait)
+
+class DescriptionCache:
+    """Persistent SQLite cache of LLM responses, keyed by a hash of model and prompt"""
+    
+    FILENAME = "llm_descriptions.sqlite3"
+    
+    def __init__(self, cache_dir: str):
+        path = Path(cache_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path / self.FILENAME
+        self.hits = 0
+        self.misses = 0
+        
+        # One connection shared by the LLM worker threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS descriptions (key TEXT PRIMARY KEY, description TEXT NOT NULL)")
+    
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], max_tokens: int,
+                 response_format: Optional[Dict[str, Any]] = None,
+                 stop: Optional[List[str]] = None) -> str:
+        """Hash everything that determines the response"""
+        parts = [model, str(max_tokens)]
+        if response_format:
+            parts.append(json.dumps(response_format, sort_keys=True))
+        if stop:
+            parts.append(json.dumps(stop))
+        parts.extend(f"{message['role']}:{message['content']}" for message in messages)
+        return hashlib.sha256("\x00".join(parts).encode('utf-8')).hexdigest()
+    
+    def __contains__(self, key: str) -> bool:
+        """Whether a key is stored, without counting a hit or miss"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM descriptions WHERE key = ?", (key,)).fetchone() is not None
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached description for a key, counting the hit or miss"""
+        with self._lock:
+            row = self._conn.execute("SELECT description FROM descriptions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+    
+    def set(self, key: str, description: str) -> None:
+        """Store a description"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO descriptions (key, description) VALUES (?, ?)", (key, description))
+    
+    def delete(self, key: str) -> None:
+        """Drop a stored description"""
+        with self._lock:
+            self._conn.execute("DELETE FROM descriptions WHERE key = ?", (key,))
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts for this run"""
+        return {'hits': self.hits, 'misses': self.misses}
+    
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
 @dataclass
 class TableContext:
     """Context information for LLM description generation"""
@@ -30,13 +212,55 @@ class TableContext:
     sample_data: List[Dict[str, Any]]
     foreign_keys: List[Dict[str, Any]]
     domain: str = "generic"
+    _sample_preview: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def sample_preview(self) -> str:
+        """Prompt section showing the first sample rows, serialized once per table"""
+        if self._sample_preview is None:
+            preview = ""
+            if self.sample_data:
+                # str() keys: orjson rejects str subclasses such as SQLAlchemy's quoted_name
+                rows = [
+                    {str(name): _truncate_sample_value(value) for name, value in row.items()}
+                    for row in self.sample_data[:SAMPLE_PREVIEW_ROWS]
+                ]
+                preview = f"\nSample data preview:\n{dumps_json(rows, indent=True, default=str).decode('utf-8')}"
+            self._sample_preview = preview
+        return self._sample_preview
+
+def _truncate_sample_value(value: Any) -> Any:
+    """Cut long text sample values, leaving other types to the serializer"""
+    if isinstance(value, str) and len(value) > SAMPLE_VALUE_MAX_CHARS:
+        return value[:SAMPLE_VALUE_MAX_CHARS] + "..."
+    return value
+
+def _build_http_client(max_connections: int) -> Any:
+    """HTTP client whose keep-alive pool holds one connection per concurrent LLM request"""
+    # Every request reuses a warm TLS connection instead of handshaking again; HTTP/2
+    # multiplexes them over one connection when the optional h2 package is installed
+    import httpx
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=LLM_REQUEST_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
 
 class LLMDescriptionGenerator:
     """Generate meaningful descriptions using LLM"""
     
-    def __init__(self, api_key: str = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: str = None, model: str = "gpt-3.5-turbo", rpm: int = 0, tpm: int = 0,
+                 cache_dir: str = None, max_connections: int = 10, attribute_model: str = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
+        # Dimension and measure descriptions are short and formulaic; a smaller model answers them faster
+        self.attribute_model = attribute_model or model
+        self.rate_limiter = RateLimiter(rpm, tpm)
+        self.cache = None
+        
+        # Prompt key -> response for this run; concurrent identical prompts wait on one request
+        self._responses: Dict[str, Future] = {}
+        self._responses_lock = threading.Lock()
         
         if not OPENAI_AVAILABLE:
             logger.warning("OpenAI library not available. Install with: pip install openai")
@@ -48,11 +272,111 @@ class LLMDescriptionGenerator:
             self.enabled = False
             return
             
-        # Initialize OpenAI client
-        from openai import OpenAI
-        self.client = OpenAI(api_key=self.api_key)
+        # Initialize OpenAI client; retries happen in _fetch_completion so each attempt is rate limited
+        import openai
+        # Transient failures worth another attempt (rate limits, timeouts, dropped connections, 5xx)
+        self._retryable_errors: Tuple[type, ...] = (
+            openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError
+        )
+        self.client = openai.OpenAI(api_key=self.api_key, timeout=LLM_REQUEST_TIMEOUT, max_retries=0,
+                             http_client=_build_http_client(max_connections))
         self.enabled = True
         logger.info(f"LLM Description Generator initialized with model: {model}")
+        
+        if cache_dir:
+            try:
+                self.cache = DescriptionCache(cache_dir)
+                logger.info(f"LLM description cache: {self.cache.path}")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM description cache unavailable, continuing without it: {e}")
+    
+    def close(self) -> None:
+        """Close the HTTP connection pool and the description cache"""
+        if self.enabled:
+            self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def _complete(self, messages: List[Dict[str, str]], max_tokens: int,
+                  response_format: Optional[Dict[str, Any]] = None,
+                  model: str = None, stop: Optional[List[str]] = None) -> str:
+        """Return the completion text, sending each distinct prompt at most once per run"""
+        model = model or self.model
+        key = DescriptionCache.make_key(model, messages, max_tokens, response_format, stop)
+        
+        with self._responses_lock:
+            response = self._responses.get(key)
+            if response is None:
+                response = self._responses[key] = Future()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            # Identical prompt already answered or in flight on another thread
+            return response.result()
+        
+        try:
+            description = self._fetch_completion(key, messages, max_tokens, response_format, model, stop)
+        except BaseException as e:
+            # Let a later identical prompt retry instead of repeating the failure
+            with self._responses_lock:
+                del self._responses[key]
+            response.set_exception(e)
+            raise
+        
+        response.set_result(description)
+        return description
+    
+    def _forget(self, messages: List[Dict[str, str]], max_tokens: int,
+                response_format: Optional[Dict[str, Any]] = None) -> None:
+        """Discard a stored response so the next identical prompt is sent again"""
+        key = DescriptionCache.make_key(self.model, messages, max_tokens, response_format)
+        with self._responses_lock:
+            self._responses.pop(key, None)
+        if self.cache is not None:
+            self.cache.delete(key)
+    
+    def _fetch_completion(self, key: str, messages: List[Dict[str, str]], max_tokens: int,
+                          response_format: Optional[Dict[str, Any]] = None,
+                          model: str = None, stop: Optional[List[str]] = None) -> str:
+        """Return the completion text, from the disk cache or from a rate-limited API call"""
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        # Roughly 4 characters per token for the prompt, plus the completion budget
+        prompt_chars = sum(len(message['content']) for message in messages)
+        request = {'response_format': response_format} if response_format else {}
+        if stop:
+            request['stop'] = stop
+        
+        for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+            self.rate_limiter.acquire(prompt_chars // 4 + max_tokens)
+            try:
+                response = self.client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=LLM_TEMPERATURE,
+                    **request
+                )
+                break
+            except self._retryable_errors as e:
+                if attempt == LLM_MAX_ATTEMPTS:
+                    raise
+                # Full jitter keeps threads that failed together from retrying together
+                delay = random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * 2 ** attempt))
+                logger.info("LLM request failed (%s), retrying in %.1fs (attempt %d of %d)",
+                            type(e).__name__, delay, attempt, LLM_MAX_ATTEMPTS)
+                time.sleep(delay)
+        
+        description = response.choices[0].message.content.strip()
+        
+        if self.cache is not None:
+            self.cache.set(key, description)
+        return description
     
     def generate_cube_description(self, table_context: TableContext) -> str:
         """Generate cube description using LLM"""
@@ -62,18 +386,12 @@ class LLMDescriptionGenerator:
         try:
             prompt = self._build_cube_prompt(table_context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a data analyst expert. Generate concise, business-friendly descriptions for data cubes in a data warehouse."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.3
-            )
+            description = self._complete([
+                {"role": "system", "content": "You are a data analyst expert. Generate concise, business-friendly descriptions for data cubes in a data warehouse."},
+                {"role": "user", "content": prompt}
+            ], max_tokens=100)
             
-            description = response.choices[0].message.content.strip()
-            logger.debug(f"Generated cube description for {table_context.table_name}: {description}")
+            logger.debug("Generated cube description for %s: %s", table_context.table_name, description)
             return description
             
         except Exception as e:
@@ -88,18 +406,12 @@ class LLMDescriptionGenerator:
         try:
             prompt = self._build_dimension_prompt(column_name, column_type, table_context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a data analyst expert. Generate concise descriptions for database columns/dimensions. Keep it under 10 words."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=50,
-                temperature=0.3
-            )
+            description = self._complete([
+                {"role": "system", "content": _DIMENSION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ], max_tokens=DIMENSION_MAX_TOKENS, model=self.attribute_model, stop=ATTRIBUTE_STOP)
             
-            description = response.choices[0].message.content.strip()
-            logger.debug(f"Generated dimension description for {column_name}: {description}")
+            logger.debug("Generated dimension description for %s: %s", column_name, description)
             return description
             
         except Exception as e:
@@ -114,31 +426,189 @@ class LLMDescriptionGenerator:
         try:
             prompt = self._build_measure_prompt(measure_name, measure_type, column_name, table_context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a data analyst expert. Generate concise descriptions for business metrics/measures. Keep it under 15 words."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=60,
-                temperature=0.3
-            )
+            description = self._complete([
+                {"role": "system", "content": _MEASURE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ], max_tokens=MEASURE_MAX_TOKENS, model=self.attribute_model, stop=ATTRIBUTE_STOP)
             
-            description = response.choices[0].message.content.strip()
-            logger.debug(f"Generated measure description for {measure_name}: {description}")
+            logger.debug("Generated measure description for %s: %s", measure_name, description)
             return description
             
         except Exception as e:
             logger.warning(f"LLM failed for measure {measure_name}: {e}")
             return self._fallback_measure_description(measure_name, measure_type)
     
+    def generate_table_descriptions(self, table_context: TableContext, measures: List[Tuple[str, str, str]],
+                                    dimensions: List[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+        """Describe a cube and all its measures and dimensions with one JSON-mode LLM request"""
+        if not self.enabled:
+            return None
+        
+        messages, max_tokens, response_format = self._table_request(table_context, measures, dimensions)
+        
+        try:
+            data = loads_json(self._complete(messages, max_tokens, response_format))
+            descriptions = {
+                'cube': _clean_description(data.get('cube_description')),
+                'measures': _named_descriptions(data.get('measures')),
+                'dimensions': _named_descriptions(data.get('dimensions'))
+            }
+        except Exception as e:
+            # Do not keep an unusable response around for the next run
+            self._forget(messages, max_tokens, response_format)
+            logger.warning(f"Batched LLM descriptions failed for {table_context.table_name}: {e}")
+            return None
+        
+        logger.debug("Generated %d batched descriptions for %s",
+                     len(descriptions['measures']) + len(descriptions['dimensions']), table_context.table_name)
+        return descriptions
+    
+    def _table_request(self, table_context: TableContext, measures: List[Tuple[str, str, str]],
+                       dimensions: List[Tuple[str, str]]) -> Tuple[List[Dict[str, str]], int, Dict[str, Any]]:
+        """Messages, token budget and response format of a table's batched description request"""
+        prompt = self._build_table_prompt(table_context, measures, dimensions)
+        messages = [
+            {"role": "system", "content": "You are a data analyst expert. Generate concise, business-friendly descriptions for a data cube and its members. Respond with JSON only."},
+            {"role": "user", "content": prompt}
+        ]
+        # About 30 tokens per description, plus the cube description and JSON syntax
+        max_tokens = min(4096, 100 + 30 * (len(measures) + len(dimensions)))
+        return messages, max_tokens, {"type": "json_object"}
+    
+    def prefetch_table_descriptions(self, tables: List[Tuple[TableContext, List[Tuple[str, str, str]], List[Tuple[str, str]]]],
+                                    work_dir: str, poll_interval: float = 30.0) -> int:
+        """Answer tables' batched description requests with one OpenAI Batch API job; returns how many arrived"""
+        # Responses go where _complete looks first (this run's responses and the disk cache),
+        # so the regular generation pass then finds them without real-time calls
+        if not self.enabled:
+            return 0
+        
+        # One batch line per distinct request not already cached; the cache key doubles as custom_id
+        requests = {}
+        for table_context, measures, dimensions in tables:
+            messages, max_tokens, response_format = self._table_request(table_context, measures, dimensions)
+            key = DescriptionCache.make_key(self.model, messages, max_tokens, response_format)
+            if key in requests or key in self._responses or (self.cache is not None and key in self.cache):
+                continue
+            requests[key] = {
+                "custom_id": key,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    "temperature": LLM_TEMPERATURE,
+                    "response_format": response_format
+                }
+            }
+        
+        if not requests:
+            return 0
+        
+        try:
+            contents = self._run_batch(list(requests.values()), Path(work_dir), poll_interval)
+        except Exception as e:
+            logger.warning(f"Batch API run failed, falling back to real-time requests: {e}")
+            return 0
+        
+        for key, content in contents.items():
+            if key not in requests:
+                continue
+            response = Future()
+            response.set_result(content)
+            with self._responses_lock:
+                self._responses.setdefault(key, response)
+            if self.cache is not None:
+                self.cache.set(key, content)
+        
+        logger.info(f"Batch API answered {len(contents)} of {len(requests)} table requests")
+        return len(contents)
+    
+    def _run_batch(self, lines: List[Dict[str, Any]], work_dir: Path, poll_interval: float) -> Dict[str, str]:
+        """Upload request lines as one batch job, wait for it, and return completion text by custom_id"""
+        work_dir.mkdir(parents=True, exist_ok=True)
+        input_path = work_dir / f"batch_input_{int(time.time())}.jsonl"
+        with open(input_path, 'wb') as f:
+            for line in lines:
+                f.write(dumps_json(line))
+                f.write(b"\n")
+        
+        with open(input_path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        # The upload holds the requests now; a failed upload leaves the file for inspection
+        input_path.unlink(missing_ok=True)
+        
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted Batch API job {batch.id} with {len(lines)} requests (input file {input_file.id})")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.debug("Batch %s status: %s", batch.id, batch.status)
+        
+        # Expired or cancelled jobs still return the requests that finished
+        if not batch.output_file_id:
+            raise RuntimeError(f"batch {batch.id} ended with status {batch.status} and no output")
+        
+        contents = {}
+        for raw in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not raw.strip():
+                continue
+            result = loads_json(raw)
+            response = result.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            try:
+                contents[result['custom_id']] = response['body']['choices'][0]['message']['content'].strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                continue
+        return contents
+    
+    def _build_table_prompt(self, table_context: TableContext, measures: List[Tuple[str, str, str]],
+                            dimensions: List[Tuple[str, str]]) -> str:
+        """Build prompt for a whole table's descriptions"""
+        
+        # Sample data preview
+        sample_preview = table_context.sample_preview()
+        
+        measure_lines = "\n".join(f"- {name} ({measure_type} of {column})" for name, measure_type, column in measures)
+        dimension_lines = "\n".join(f"- {name} ({column_type})" for name, column_type in dimensions)
+        
+        # Instructions first, so every table's request shares them as a cacheable prefix
+        prompt = f"""
+Describe the database table below, used as a data cube, and each of its measures and dimensions.
+
+Return a JSON object of this shape:
+{{"cube_description": "...", "measures": [{{"name": "...", "description": "..."}}], "dimensions": [{{"name": "...", "description": "..."}}]}}
+
+The cube description is 1 sentence on the business entity/process the table represents.
+Measure descriptions stay under 15 words and dimension descriptions under 10 words, in business terms.
+Use the exact measure and dimension names listed below.
+
+Domain: {table_context.domain}
+Table: {table_context.table_name}
+Schema: {table_context.schema}
+Table Type: {table_context.table_type}
+{sample_preview}
+
+Measures:
+{measure_lines or '- (none)'}
+
+Dimensions:
+{dimension_lines or '- (none)'}
+"""
+        return prompt.strip()
+    
     def _build_cube_prompt(self, table_context: TableContext) -> str:
         """Build prompt for cube description"""
         
         # Sample data preview
-        sample_preview = ""
-        if table_context.sample_data:
-            sample_preview = f"\nSample data preview:\n{json.dumps(table_context.sample_data[:2], indent=2, default=str)}"
+        sample_preview = table_context.sample_preview()
         
         # Column summary
         column_names = [col['name'] for col in table_context.columns[:10]]
@@ -160,66 +630,91 @@ Focus on business value, not technical details.
     
     def _build_dimension_prompt(self, column_name: str, column_type: str, table_context: TableContext) -> str:
         """Build prompt for dimension description"""
-        
-        prompt = f"""
-Generate a concise description for this database column used as a dimension:
-
-Table: {table_context.table_name}
-Column: {column_name}
-Type: {column_type}
-Domain: {table_context.domain}
-
-Describe what this column represents in business terms. Keep it under 10 words.
-Examples:
-- customer_id → "Unique customer identifier"
-- order_date → "Date when order was placed"
-- product_category → "Product classification category"
-"""
-        return prompt.strip()
+        return (f"{_DIMENSION_PROMPT_PREFIX}\n"
+                f"Domain: {table_context.domain}\n"
+                f"Table: {table_context.table_name}\n"
+                f"Column: {column_name}\n"
+                f"Type: {column_type}")
     
     def _build_measure_prompt(self, measure_name: str, measure_type: str, column_name: str, table_context: TableContext) -> str:
         """Build prompt for measure description"""
-        
-        prompt = f"""
-Generate a concise description for this business metric/measure:
-
-Measure: {measure_name}
-Type: {measure_type}
-Source Column: {column_name}
-Table: {table_context.table_name}
-Domain: {table_context.domain}
-
-Describe what this metric measures in business terms. Keep it under 15 words.
-Examples:
-- sum_amount → "Total monetary value of all transactions"
-- avg_price → "Average price across all products"
-- count_orders → "Total number of orders placed"
-"""
-        return prompt.strip()
+        return (f"{_MEASURE_PROMPT_PREFIX}\n"
+                f"Domain: {table_context.domain}\n"
+                f"Table: {table_context.table_name}\n"
+                f"Source Column: {column_name}\n"
+                f"Measure: {measure_name}\n"
+                f"Type: {measure_type}")
     
     def _fallback_cube_description(self, table_name: str) -> str:
         """Fallback cube description when LLM is not available"""
-        formatted_name = table_name.replace('_', ' ').title()
+        formatted_name = _pretty(table_name)
         return f"Data cube for {formatted_name} analysis"
     
     def _fallback_dimension_description(self, column_name: str) -> str:
         """Fallback dimension description when LLM is not available"""
-        formatted_name = column_name.replace('_', ' ').title()
+        formatted_name = _pretty(column_name)
         return f"{formatted_name} dimension"
     
     def _fallback_measure_description(self, measure_name: str, measure_type: str) -> str:
         """Fallback measure description when LLM is not available"""
-        formatted_name = measure_name.replace('_', ' ').title()
+        formatted_name = _pretty(measure_name)
         return f"{formatted_name} metric"
 
+def _clean_description(value: Any) -> Optional[str]:
+    """A stripped, non-empty description string from an LLM JSON value, or None"""
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+def _named_descriptions(items: Any) -> Dict[str, str]:
+    """Map names to descriptions from a JSON list of {name, description} (or a name -> description object)"""
+    if isinstance(items, dict):
+        items = [{'name': name, 'description': description} for name, description in items.items()]
+    
+    descriptions = {}
+    for item in items or ():
+        if isinstance(item, dict) and isinstance(item.get('name'), str):
+            description = _clean_description(item.get('description'))
+            if description is not None:
+                descriptions[item['name']] = description
+    return descriptions
+
+@lru_cache(maxsize=4096)
+def _basic_dimension_text(column_name: str) -> str:
+    """Template dimension description (memoized; names like id and created_at recur across tables)"""
+    formatted_name = _pretty(column_name)
+    
+    # Smart mappings for common column patterns
+    if column_name.endswith('_id'):
+        entity = _pretty(column_name[:-3])
+        return f"Unique {entity} identifier"
+    elif 'date' in column_name or 'time' in column_name:
+        return f"Date/time when {formatted_name.lower()} occurred"
+    elif column_name in ['status', 'state']:
+        return f"Current status or state"
+    elif column_name in ['name', 'title']:
+        return f"Display name or title"
+    elif 'zip' in column_name or 'postal' in column_name:
+        return f"Postal/ZIP code"
+    elif 'city' in column_name:
+        return f"City location"
+    elif 'state' in column_name and 'status' not in column_name:
+        return f"State/province location"
+    else:
+        return f"{formatted_name} attribute"
+
 class EnhancedDescriptionService:
     """Service to coordinate LLM and fallback description generation"""
     
-    def __init__(self, enable_llm: bool = True, api_key: str = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, enable_llm: bool = True, api_key: str = None, model: str = "gpt-3.5-turbo",
+                 rpm: int = 0, tpm: int = 0, cache_dir: str = None, tier: str = 'full',
+                 max_connections: int = 10, attribute_model: str = None):
         self.llm_generator = None
+        self.tier = tier
         
         if enable_llm:
-            self.llm_generator = LLMDescriptionGenerator(api_key, model)
+            self.llm_generator = LLMDescriptionGenerator(api_key, model, rpm, tpm, cache_dir, max_connections,
+                                                         attribute_model)
             if self.llm_generator.enabled:
                 logger.info("Enhanced descriptions enabled with LLM")
             else:
@@ -227,6 +722,69 @@ class EnhancedDescriptionService:
         else:
             logger.info("LLM descriptions disabled by configuration")
     
+    @property
+    def llm_enabled(self) -> bool:
+        """Whether descriptions come from the LLM rather than basic templates"""
+        return bool(self.llm_generator and self.llm_generator.enabled)
+    
+    def close(self) -> None:
+        """Release the LLM client's connections"""
+        if self.llm_generator:
+            self.llm_generator.close()
+    
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """LLM description cache hits and misses, or None when no cache is in use"""
+        if self.llm_generator and self.llm_generator.cache is not None:
+            return self.llm_generator.cache.stats()
+        return None
+    
+    def describe_trivial(self, kind: str, name: str, type_name: str, column_name: str,
+                         table_context: TableContext) -> Optional[str]:
+        """Template description for a trivial measure or dimension under the cheap tier, else None"""
+        if self.tier != 'cheap' or not self.llm_enabled:
+            return None
+        
+        if kind == 'measure' and type_name in TRIVIAL_MEASURE_TEMPLATES:
+            return self.describe_template_measure(type_name, column_name, table_context)
+        
+        if (kind == 'measure' and type_name in CURRENCY_MEASURE_TEMPLATES
+                and CURRENCY_COLUMN_RE.search(column_name.lower())):
+            return self.describe_template_measure(type_name, column_name, table_context, CURRENCY_MEASURE_TEMPLATES)
+        
+        if kind == 'dimension':
+            match = _TRIVIAL_DIMENSION_RE.search(name.lower())
+            if match is None:
+                return None
+            if match.group(1):
+                return f"When the {table_context.table_name.replace('_', ' ')} record was {match.group(1)}"
+            return self._basic_dimension_description(name.lower(), table_context.table_type)
+        
+        return None
+    
+    def describe_template_measure(self, measure_type: str, column_name: str, table_context: TableContext,
+                                  templates: Mapping[str, str] = TRIVIAL_MEASURE_TEMPLATES) -> str:
+        """Fixed description for a measure type from templates (count, count_distinct, min or max by default)"""
+        return templates[measure_type].format(
+            table=table_context.table_name.replace('_', ' '),
+            column=column_name.replace('_', ' ')
+        )
+    
+    def describe_table_bulk(self, table_context: TableContext, measures: List[Tuple[str, str, str]],
+                            dimensions: List[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+        """Describe a cube, its measures (name, type, column) and dimensions (name, type) in one request"""
+        # {'cube': str or None, 'measures': {name: str}, 'dimensions': {name: str}}, or None when the
+        # LLM is unavailable or the request failed; callers describe missing entries one by one
+        if self.llm_generator and self.llm_generator.enabled:
+            return self.llm_generator.generate_table_descriptions(table_context, measures, dimensions)
+        return None
+    
+    def prefetch_table_descriptions(self, tables: List[Tuple[TableContext, List[Tuple[str, str, str]], List[Tuple[str, str]]]],
+                                    work_dir: str, poll_interval: float = 30.0) -> int:
+        """Answer describe_table_bulk requests for many tables ahead of time with one Batch API job"""
+        if self.llm_generator and self.llm_generator.enabled:
+            return self.llm_generator.prefetch_table_descriptions(tables, work_dir, poll_interval)
+        return 0
+    
     def describe_cube(self, table_context: TableContext) -> str:
         """Generate cube description"""
         if self.llm_generator and self.llm_generator.enabled:
@@ -250,7 +808,7 @@ class EnhancedDescriptionService:
     
     def _basic_cube_description(self, table_name: str, table_type: str) -> str:
         """Basic cube description with table type awareness"""
-        formatted_name = table_name.replace('_', ' ').title()
+        formatted_name = _pretty(table_name)
         
         if table_type == 'fact':
             return f"{formatted_name} transaction and metrics data"
@@ -263,30 +821,11 @@ class EnhancedDescriptionService:
     
     def _basic_dimension_description(self, column_name: str, table_type: str) -> str:
         """Basic dimension description with context awareness"""
-        formatted_name = column_name.replace('_', ' ').title()
-        
-        # Smart mappings for common column patterns
-        if column_name.endswith('_id'):
-            entity = column_name[:-3].replace('_', ' ').title()
-            return f"Unique {entity} identifier"
-        elif 'date' in column_name or 'time' in column_name:
-            return f"Date/time when {formatted_name.lower()} occurred"
-        elif column_name in ['status', 'state']:
-            return f"Current status or state"
-        elif column_name in ['name', 'title']:
-            return f"Display name or title"
-        elif 'zip' in column_name or 'postal' in column_name:
-            return f"Postal/ZIP code"
-        elif 'city' in column_name:
-            return f"City location"
-        elif 'state' in column_name and 'status' not in column_name:
-            return f"State/province location"
-        else:
-            return f"{formatted_name} attribute"
+        return _basic_dimension_text(column_name)
     
     def _basic_measure_description(self, measure_name: str, measure_type: str, domain: str) -> str:
         """Basic measure description with domain awareness"""
-        formatted_name = measure_name.replace('_', ' ').title()
+        formatted_name = _pretty(measure_name)
         
         # Domain-specific descriptions
         if domain == 'ecommerce':
@@ -10,13 +10,19 @@ import os
 import sys
 import argparse
 import logging
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple, Union
 from pathlib import Path
 
 # Import our modules
-from enhanced_postgres_to_cubedev import EnhancedCubeGenerator, DatabaseConfig
+from enhanced_postgres_to_cubedev import EnhancedCubeGenerator, ColumnView, DatabaseConfig, GenerationStats
+from cubedev_utils import BackgroundWriter, validate_cube_definition
 from postgres_to_cubedev import PostgreSQLIntrospector, TableInfo
-from llm_descriptions import EnhancedDescriptionService, TableContext
+from llm_descriptions import EnhancedDescriptionService, TableContext, LLM_TIERS
+from cubedev_config import MEASURE_GENERATION_RULES, NUMERIC_MEASURE_RULE_RE, CURRENCY_COLUMN_RE
 
 # Configure logging
 logging.basicConfig(
@@ -25,28 +31,216 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class LLMGenerationStats(GenerationStats):
+    """Generation counters plus descriptions templated instead of sent to the LLM"""
+    llm_skipped: int = 0
+
+@dataclass(slots=True)
+class _PendingDescription:
+    """A describe_* call not sent yet, possibly answered by its table's batched request"""
+    describe: Callable[..., str]
+    args: Tuple[Any, ...]
+    section: str = ''
+    name: str = ''
+    batch: Optional[Future] = None
+    
+    def batched_result(self) -> Optional[str]:
+        """This entry's description from the batched request, or None if it has none"""
+        if self.batch is None:
+            return None
+        try:
+            descriptions = self.batch.result()
+        except Exception:
+            return None
+        if descriptions is None:
+            return None
+        if self.section == 'cube':
+            return descriptions['cube']
+        return descriptions[self.section].get(self.name)
+
 class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
     """Enhanced generator with LLM-powered descriptions"""
     
     def __init__(self, output_dir: str = "model", config_profile: str = "default", 
-                 enable_llm: bool = True, llm_model: str = "gpt-3.5-turbo"):
+                 enable_llm: bool = True, llm_model: str = "gpt-3.5-turbo", llm_concurrency: int = 10,
+                 llm_rpm: int = 0, llm_tpm: int = 0, llm_cache_dir: Optional[str] = None,
+                 llm_batch_descriptions: bool = True, llm_tier: str = 'full',
+                 llm_attribute_model: Optional[str] = None):
         super().__init__(output_dir, config_profile)
+        self.generation_stats = LLMGenerationStats()
         
         # Initialize LLM description service
         api_key = os.getenv("OPENAI_API_KEY")
         self.description_service = EnhancedDescriptionService(
             enable_llm=enable_llm,
             api_key=api_key,
-            model=llm_model
+            model=llm_model,
+            rpm=llm_rpm,
+            tpm=llm_tpm,
+            cache_dir=llm_cache_dir,
+            tier=llm_tier,
+            max_connections=max(1, llm_concurrency),
+            attribute_model=llm_attribute_model
         )
         
+        # LLM requests are I/O bound, so up to llm_concurrency of them run at once
+        self._llm_executor = None
+        if self.description_service.llm_enabled:
+            self._llm_executor = ThreadPoolExecutor(max_workers=max(1, llm_concurrency), thread_name_prefix="llm")
+        
+        # Describe each table with one request, falling back per attribute for anything it misses
+        self.llm_batch_descriptions = llm_batch_descriptions
+        
         logger.info(f"LLM Enhanced Generator initialized (LLM: {'enabled' if enable_llm else 'disabled'})")
     
-    def generate_enhanced_cube_with_llm(self, table_info: TableInfo, sample_data: List[Dict] = None) -> Dict[str, Any]:
-        """Generate cube with LLM-enhanced descriptions"""
+    def close(self) -> None:
+        """Stop the LLM pool and release the LLM client's connections"""
+        if self._llm_executor is not None:
+            self._llm_executor.shutdown()
+        self.description_service.close()
+    
+    def _describe(self, describe: Callable[..., str], *args: Any) -> Union[str, _PendingDescription]:
+        """Run a describe_* call now, or leave it pending for the LLM pool when the LLM is enabled"""
+        if self._llm_executor is None:
+            return describe(*args)
+        return _PendingDescription(describe, args)
+    
+    def _describe_measure(self, measure_name: str, measure_type: str, column_name: str,
+                          table_context: TableContext) -> Union[str, _PendingDescription]:
+        """Describe a measure, from a template when the tier treats it as trivial"""
+        trivial = self.description_service.describe_trivial('measure', measure_name, measure_type, column_name, table_context)
+        if trivial is not None:
+            self.generation_stats.llm_skipped += 1
+            return trivial
+        return self._describe(self.description_service.describe_measure, measure_name, measure_type, column_name, table_context)
+    
+    def _describe_default_measure(self, measure_type: str, column_name: str,
+                                  table_context: TableContext) -> str:
+        """Describe the count / primary key count_distinct measure every cube gets"""
+        # Their LLM descriptions never vary meaningfully, so the LLM is not asked for them
+        if self._llm_executor is None:
+            return self.description_service.describe_measure(measure_type, measure_type, column_name, table_context)
+        self.generation_stats.llm_skipped += 1
+        return self.description_service.describe_template_measure(measure_type, column_name, table_context)
+    
+    def _describe_dimension(self, column_name: str, column_type: str, table_context: TableContext) -> Union[str, _PendingDescription]:
+        """Describe a dimension, from a template when the tier treats it as trivial"""
+        trivial = self.description_service.describe_trivial('dimension', column_name, column_type, column_name, table_context)
+        if trivial is not None:
+            self.generation_stats.llm_skipped += 1
+            return trivial
+        return self._describe(self.description_service.describe_dimension, column_name, column_type, table_context)
+    
+    def _send_description(self, description: _PendingDescription) -> Future:
+        """Send one pending description on its own request"""
+        return self._llm_executor.submit(description.describe, *description.args)
+    
+    @staticmethod
+    def _pending_descriptions(cube: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """The (section, item) pairs of a cube whose descriptions are still pending"""
+        return [
+            (section, item)
+            for section, items in (('cube', (cube,)), ('measures', cube.get('measures', ())),
+                                   ('dimensions', cube.get('dimensions', ())))
+            for item in items
+            if isinstance(item.get('description'), _PendingDescription)
+        ]
+    
+    @staticmethod
+    def _table_bulk_request(pending: List[Tuple[str, Dict[str, Any]]]) -> Tuple[TableContext, List[Tuple], List[Tuple]]:
+        """describe_table_bulk arguments covering a cube's pending descriptions"""
+        # Every describe_* call takes the table context last; describe_measure's other
+        # args are (name, type, column) and describe_dimension's are (name, type)
+        return (
+            pending[0][1]['description'].args[-1],
+            [item['description'].args[:3] for section, item in pending if section == 'measures'],
+            [item['description'].args[:2] for section, item in pending if section == 'dimensions']
+        )
+    
+    def _dispatch_cube_descriptions(self, cube: Dict[str, Any]) -> None:
+        """Start the LLM requests for a cube's pending descriptions"""
+        if self._llm_executor is None:
+            return  # Descriptions were templated inline; nothing is pending
+        
+        pending = self._pending_descriptions(cube)
+        if not pending:
+            return
+        
+        if not self.llm_batch_descriptions:
+            for section, item in pending:
+                item['description'] = self._send_description(item['description'])
+            return
+        
+        batch = self._llm_executor.submit(self.description_service.describe_table_bulk,
+                                          *self._table_bulk_request(pending))
+        for section, item in pending:
+            description = item['description']
+            description.section = section
+            description.name = item['name']
+            description.batch = batch
+    
+    def _resolve_descriptions(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Replace pending LLM descriptions with their results, in place"""
+        if self._llm_executor is None:
+            return
+        
+        items = list(items)
+        
+        # Take what the batched request answered; send everything else at once before waiting
+        for item in items:
+            description = item.get('description')
+            if isinstance(description, _PendingDescription):
+                text = description.batched_result()
+                item['description'] = text if text is not None else self._send_description(description)
+        
+        for item in items:
+            description = item.get('description')
+            if isinstance(description, Future):
+                item['description'] = description.result()
+    
+    def _resolve_cube_descriptions(self, cube: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for every pending description in a cube"""
+        self._resolve_descriptions((cube, *cube.get('measures', ()), *cube.get('dimensions', ())))
+        return cube
+    
+    def _prefetch_batch_descriptions(self, cubes: List[Dict[str, Any]], poll_interval: float) -> None:
+        """Answer the cubes' batched description requests through one OpenAI Batch API job"""
+        requests = []
+        for cube in cubes:
+            pending = self._pending_descriptions(cube)
+            if pending:
+                requests.append(self._table_bulk_request(pending))
+        if not requests:
+            return
+        
+        work_dir = Path(self.output_dir) / ".cache" / "batch"
+        logger.info(f"Submitting {len(requests)} table description requests to the OpenAI Batch API...")
+        received = self.description_service.prefetch_table_descriptions(requests, str(work_dir), poll_interval)
+        logger.info(f"Batch API answered {received} of {len(requests)} table description requests")
+    
+    def _generate_cube_for_table(self, table_info: TableInfo) -> Dict[str, Any]:
+        """Generate one table's cube for process_database, with basic descriptions when the LLM is off"""
+        return self.generate_enhanced_cube_with_llm(table_info)
+    
+    def _worker_factory(self) -> Callable[[str, str], EnhancedCubeGenerator]:
+        """Build the generator each worker process uses, from (output_dir, config_profile)"""
+        # Workers only run when the LLM is off, so they must not enable it from the environment
+        return partial(type(self), enable_llm=False)
+    
+    def _save_cube_with_llm(self, cube: Dict[str, Any]) -> str:
+        """Save a cube once its LLM descriptions have arrived"""
+        return self.file_manager.save_cube_file(self._resolve_cube_descriptions(cube))
+    
+    def generate_enhanced_cube_with_llm(self, table_info: TableInfo, sample_data: List[Dict] = None,
+                                        defer_descriptions: bool = False) -> Dict[str, Any]:
+        """Generate cube with LLM-enhanced descriptions (left pending for _dispatch_cube_descriptions if defer_descriptions)"""
+        
+        # Walk the columns once and share the result with every generator
+        view = self._precompute_column_view(table_info)
         
         # Classify table
-        table_type = self.classify_table_enhanced(table_info, sample_data)
+        table_type = self.classify_table_enhanced(table_info, sample_data, view)
         
         # Create table context for LLM
         table_context = TableContext(
@@ -60,16 +254,19 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
         )
         
         # Base cube structure with LLM description
+        qualified_name = table_info.qualified_name
         cube = {
             'name': self.utils.sanitize_name(table_info.name),
-            'sql_table': f"{table_info.schema}.{table_info.name}",
-            'description': self.description_service.describe_cube(table_context)
+            'sql_table': qualified_name,
+            'description': self._describe(self.description_service.describe_cube, table_context)
         }
         
         # Generate components with LLM descriptions
-        measures = self.generate_enhanced_measures_with_llm(table_info, table_type, table_context)
-        dimensions = self.generate_enhanced_dimensions_with_llm(table_info, table_context)
-        segments = self.generate_enhanced_segments(table_info)  # Keep existing logic
+        measures = self.generate_enhanced_measures_with_llm(table_info, table_type, table_context, view,
+                                                            defer_descriptions=True)
+        dimensions = self.generate_enhanced_dimensions_with_llm(table_info, table_context, view,
+                                                                defer_descriptions=True)
+        segments = self.generate_enhanced_segments(table_info, view)  # Keep existing logic
         
         if measures:
             cube['measures'] = measures
@@ -84,22 +281,30 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
             cube['joins'] = joins
         
         if table_type == 'fact':
-            pre_aggs = self.generate_enhanced_pre_aggregations(table_info, table_type)
+            pre_aggs = self.generate_enhanced_pre_aggregations(table_info, table_type, view)
             if pre_aggs:
                 cube['pre_aggregations'] = pre_aggs
         
         # Add metadata
         cube['_metadata'] = {
             'table_type': table_type,
-            'source_table': f"{table_info.schema}.{table_info.name}",
+            'source_table': qualified_name,
             'column_count': len(table_info.columns),
             'foreign_key_count': len(table_info.foreign_keys),
+            'time_dimensions': view.time_dim_names,
             'llm_enhanced': True
         }
         
+        # Deferred cubes are dispatched by the caller, which may batch them first
+        if not defer_descriptions:
+            self._dispatch_cube_descriptions(cube)
+            self._resolve_cube_descriptions(cube)
+        
         return cube
     
-    def generate_enhanced_measures_with_llm(self, table_info: TableInfo, table_type: str, table_context: TableContext) -> List[Dict[str, Any]]:
+    def generate_enhanced_measures_with_llm(self, table_info: TableInfo, table_type: str, table_context: TableContext,
+                                            view: ColumnView = None,
+                                            defer_descriptions: bool = False) -> List[Dict[str, Any]]:
         """Generate measures with LLM descriptions"""
         measures = []
         
@@ -107,9 +312,7 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
         measures.append({
             'name': 'count',
             'type': 'count',
-            'description': self.description_service.describe_measure(
-                'count', 'count', 'all_records', table_context
-            )
+            'description': self._describe_default_measure('count', 'all_records', table_context)
         })
         
         if table_info.primary_keys:
@@ -118,87 +321,86 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
                 'name': 'count_distinct',
                 'sql': pk_col,
                 'type': 'count_distinct',
-                'description': self.description_service.describe_measure(
-                    'count_distinct', 'count_distinct', pk_col, table_context
-                )
+                'description': self._describe_default_measure('count_distinct', pk_col, table_context)
             })
         
         # Generate numeric measures with LLM descriptions
-        for col in table_info.columns:
-            col_type = self._map_sql_type_to_cube(col['type'])
-            col_name = col['name'].lower()
-            
-            if col_type == 'number' and col['name'] not in table_info.primary_keys:
+        if view is None:
+            view = self._precompute_column_view(table_info)
+        
+        currency_search = CURRENCY_COLUMN_RE.search
+        for name, col_name, col_type, is_pk in zip(view.names, view.names_lower, view.cube_types, view.is_pk):
+            if col_type == 'number' and not is_pk:
                 # Determine appropriate measure types
                 measure_types = self._get_measure_types_for_column(col_name)
+                is_currency = currency_search(col_name) is not None
                 
                 for measure_type in measure_types:
-                    measure_name = f"{measure_type}_{col['name']}"
+                    measure_name = f"{measure_type}_{name}"
                     measure = {
                         'name': measure_name,
-                        'sql': col['name'],
+                        'sql': name,
                         'type': measure_type,
-                        'description': self.description_service.describe_measure(
-                            measure_name, measure_type, col['name'], table_context
-                        )
+                        'description': self._describe_measure(measure_name, measure_type, name, table_context)
                     }
                     
                     # Add format for financial columns
-                    if any(term in col_name for term in ['amount', 'price', 'cost', 'value', 'total']):
+                    if is_currency:
                         measure['format'] = 'currency'
                     
                     measures.append(measure)
         
+        if not defer_descriptions:
+            self._resolve_descriptions(measures)
+        
         return measures
     
-    def generate_enhanced_dimensions_with_llm(self, table_info: TableInfo, table_context: TableContext) -> List[Dict[str, Any]]:
+    def generate_enhanced_dimensions_with_llm(self, table_info: TableInfo, table_context: TableContext,
+                                              view: ColumnView = None,
+                                              defer_descriptions: bool = False) -> List[Dict[str, Any]]:
         """Generate dimensions with LLM descriptions"""
         dimensions = []
+        if view is None:
+            view = self._precompute_column_view(table_info)
         
-        for col in table_info.columns:
-            cube_type = self._map_sql_type_to_cube(col['type'])
-            
+        for name, col_name, sql_type, cube_type, is_pk in zip(view.names, view.names_lower, view.sql_types,
+                                                              view.cube_types, view.is_pk):
             dimension = {
-                'name': col['name'],
-                'sql': col['name'],
+                'name': name,
+                'sql': name,
                 'type': cube_type,
-                'description': self.description_service.describe_dimension(
-                    col['name'], col['type'], table_context
-                )
+                'description': self._describe_dimension(name, sql_type, table_context)
             }
             
             # Mark primary key
-            if col['name'] in table_info.primary_keys:
+            if is_pk:
                 dimension['primary_key'] = True
             
             # Add time dimension granularities
             if cube_type == 'time':
-                from cubedev_config import DIMENSION_GENERATION_RULES
-                time_config = DIMENSION_GENERATION_RULES['time_dimensions']
-                dimension['granularities'] = time_config['granularities'].copy()
-                
-                # Add custom granularities for specific columns
-                col_name = col['name'].lower()
-                if any(pattern in col_name for pattern in ['created_at', 'updated_at']):
-                    dimension['granularities'].extend(time_config['custom_granularities'])
+                dimension['granularities'] = self._time_granularities(col_name)
             
             dimensions.append(dimension)
         
+        if not defer_descriptions:
+            self._resolve_descriptions(dimensions)
+        
         return dimensions
     
     def _get_measure_types_for_column(self, col_name: str) -> List[str]:
         """Get appropriate measure types for a column"""
-        from cubedev_config import MEASURE_GENERATION_RULES
-        
         # Check for common measure patterns
-        for rule_name, rule_config in MEASURE_GENERATION_RULES['numeric_measures'].items():
-            if any(pattern in col_name for pattern in rule_config['patterns']):
-                return rule_config['measures']
+        m = NUMERIC_MEASURE_RULE_RE.match(col_name)
+        if m:
+            return MEASURE_GENERATION_RULES['numeric_measures'][m.lastgroup]['measures']
         
         # Default measures for numeric columns
         return ['sum', 'avg', 'min', 'max']
     
-    def process_database_with_llm(self, introspector: PostgreSQLIntrospector, tables: List[str] = None) -> Dict[str, Any]:
+    def process_database_with_llm(self, introspector: PostgreSQLIntrospector, tables: List[str] = None,
+                                  use_batch_api: bool = False, batch_poll_interval: float = 30.0,
+                                  use_cache: bool = False, refresh_cache: bool = False,
+                                  max_workers: int = 1, use_threads: bool = False) -> Dict[str, Any]:
         """Process database with LLM enhancements"""
         
         logger.info("Starting LLM-enhanced database processing...")
@@ -207,67 +409,115 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
         if not tables:
             tables = introspector.get_tables()
         
+        if max_workers > 1:
+            if not self.description_service.llm_enabled:
+                # Without LLM calls every table is independent CPU work, so fan out like process_database
+                summary = self.process_database(introspector, tables, max_workers, use_threads, use_cache, refresh_cache)
+                summary['llm_enhanced'] = True
+                return summary
+            logger.info("Ignoring workers: LLM requests already run concurrently (see llm_concurrency)")
+        
         logger.info(f"Processing {len(tables)} tables with LLM descriptions...")
         
         cubes = []
+        cubes_by_type = defaultdict(list)
         errors = []
+        pending = []
+        
+        # The Batch API answers every table's request in one job, so cubes wait for it before dispatch
+        use_batch_api = use_batch_api and self.description_service.llm_enabled and self.llm_batch_descriptions
+        held = []
+        
+        self._prefetch_tables(introspector, tables, use_cache, refresh_cache)
+        
+        # Sample rows only feed the LLM prompts; fetch them for every table at once up front
+        samples = introspector.get_sample_data_bulk(tables, limit=3) if self.description_service.llm_enabled else {}
         
-        # Process each table
-        for table_name in tables:
+        # Process each table; LLM requests for later tables are already in flight while
+        # the writer thread waits on earlier cubes' descriptions and saves them in order
+        with BackgroundWriter() as writer:
+            for table_name in tables:
+                try:
+                    logger.info("Processing table: %s", table_name)
+                    
+                    # Introspect table
+                    table_info = self._prefetched_tables.pop(table_name, None)
+                    if table_info is None:
+                        table_info = introspector.introspect_table(table_name)
+                    
+                    # Get sample data for LLM context
+                    sample_data = samples.get(table_name)
+                    
+                    # Generate cube with LLM descriptions
+                    cube = self.generate_enhanced_cube_with_llm(table_info, sample_data, defer_descriptions=True)
+                    
+                    # Validate cube
+                    is_valid, validation_errors = validate_cube_definition(cube)
+                    if not is_valid:
+                        logger.warning("Validation errors for %s: %s", table_name, validation_errors)
+                        errors.extend(validation_errors)
+                    
+                    if use_batch_api:
+                        held.append((table_name, cube))
+                        continue
+                    
+                    # Save cube; the writer holds it until saved and only its summary is kept
+                    self._dispatch_cube_descriptions(cube)
+                    pending.append((table_name, self.summarize_cube(cube), writer.submit(self._save_cube_with_llm, cube)))
+                    
+                except Exception as e:
+                    logger.error(f"Error processing table {table_name}: {e}")
+                    errors.append(f"Table {table_name}: {str(e)}")
+                    self.generation_stats.errors += 1
+                    continue
+            
+            if held:
+                # Anything the batch job did not answer falls back to real-time requests
+                self._prefetch_batch_descriptions([cube for table_name, cube in held], batch_poll_interval)
+                for table_name, cube in held:
+                    self._dispatch_cube_descriptions(cube)
+                    pending.append((table_name, self.summarize_cube(cube), writer.submit(self._save_cube_with_llm, cube)))
+                held = []
+        
+        self._prefetched_tables = {}
+        
+        # Collect saved cubes' summaries in table order once all writes have drained
+        for table_name, cube, saved in pending:
             try:
-                logger.info(f"Processing table: {table_name}")
-                
-                # Introspect table
-                table_info = introspector.introspect_table(table_name)
-                
-                # Get sample data for LLM context
-                sample_data = introspector.get_sample_data(table_name, limit=3)
-                
-                # Generate cube with LLM descriptions
-                cube = self.generate_enhanced_cube_with_llm(table_info, sample_data)
-                
-                # Validate cube
-                from cubedev_utils import validate_cube_definition
-                is_valid, validation_errors = validate_cube_definition(cube)
-                if not is_valid:
-                    logger.warning(f"Validation errors for {table_name}: {validation_errors}")
-                    errors.extend(validation_errors)
-                
-                # Save cube
-                filepath = self.file_manager.save_cube_file(cube)
-                self.generated_files.append(filepath)
-                cubes.append(cube)
-                
-                # Update stats
-                table_type = cube.get('_metadata', {}).get('table_type', 'unknown')
-                self.generation_stats['cubes'] += 1
-                self.generation_stats[f'{table_type}_tables'] = self.generation_stats.get(f'{table_type}_tables', 0) + 1
-                
-                logger.info(f"Generated LLM-enhanced cube for {table_name} (type: {table_type})")
-                
+                filepath = saved.result()
             except Exception as e:
                 logger.error(f"Error processing table {table_name}: {e}")
                 errors.append(f"Table {table_name}: {str(e)}")
-                self.generation_stats['errors'] += 1
+                self.generation_stats.errors += 1
                 continue
+            
+            self.generated_files.append(filepath)
+            cubes.append(cube)
+            
+            # Update stats
+            table_type = cube['_metadata']['table_type']
+            cubes_by_type[table_type].append(cube)
+            self.generation_stats.count_cube(table_type)
+            
+            logger.info("Generated LLM-enhanced cube for %s (type: %s)", table_name, table_type)
         
         # Generate views
         logger.info("Generating views...")
-        views = self.generate_domain_specific_views(cubes)
+        views = self.generate_domain_specific_views(cubes, cubes_by_type=cubes_by_type)
         
         for view in views:
             try:
                 # Save view
                 filepath = self.file_manager.save_view_file(view)
                 self.generated_files.append(filepath)
-                self.generation_stats['views'] += 1
+                self.generation_stats.views += 1
                 
-                logger.info(f"Generated view: {view['name']}")
+                logger.info("Generated view: %s", view['name'])
                 
             except Exception as e:
                 logger.error(f"Error generating view {view.get('name', 'unknown')}: {e}")
                 errors.append(f"View {view.get('name', 'unknown')}: {str(e)}")
-                self.generation_stats['errors'] += 1
+                self.generation_stats.errors += 1
         
         # Create index file
         index_file = self.file_manager.create_index_file(self.generated_files)
@@ -275,7 +525,7 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
         # Generate summary
         summary = {
             'total_files': len(self.generated_files),
-            'stats': self.generation_stats,
+            'stats': self.generation_stats.to_dict(),
             'errors': errors,
             'output_directory': self.output_dir,
             'generated_files': self.generated_files,
@@ -283,7 +533,12 @@ class LLMEnhancedCubeGenerator(EnhancedCubeGenerator):
             'llm_enhanced': True
         }
         
-        logger.info(f"LLM-enhanced generation complete! Summary: {self.generation_stats}")
+        cache_stats = self.description_service.cache_stats()
+        if cache_stats is not None:
+            summary['llm_cache'] = cache_stats
+            logger.info("LLM description cache: %d hits, %d misses", cache_stats['hits'], cache_stats['misses'])
+        
+        logger.info("LLM-enhanced generation complete! Summary: %s", self.generation_stats.to_dict())
         
         return summary
 
@@ -310,17 +565,45 @@ Examples:
     parser.add_argument("--port", type=int, default=5432, help="PostgreSQL port")
     parser.add_argument("--database", required=True, help="Database name")
     parser.add_argument("--username", required=True, help="Database username")
-    parser.add_argument("--password", required=True, help="Database password")
+    parser.add_argument("--password", help="Database password (default: PGPASSWORD or ~/.pgpass)")
     parser.add_argument("--schema", default="public", help="Database schema")
     
     # Generation options
     parser.add_argument("--output-dir", default="model_llm", help="Output directory for YAML files")
     parser.add_argument("--tables", nargs="*", help="Specific tables to process")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Number of tables to process in parallel with --no-llm (default: 1)")
+    parser.add_argument("--use-threads", action="store_true",
+                       help="Parallelize with threads instead of processes (for I/O-bound databases)")
     parser.add_argument("--domain", default="ecommerce", help="Domain for templates")
     
     # LLM options
     parser.add_argument("--no-llm", action="store_true", help="Disable LLM descriptions")
     parser.add_argument("--llm-model", default="gpt-3.5-turbo", help="LLM model to use")
+    parser.add_argument("--llm-attribute-model",
+                       help="Smaller model for per-attribute dimension and measure descriptions, "
+                            "e.g. gpt-4o-mini (default: --llm-model)")
+    parser.add_argument("--llm-concurrency", type=int, default=10,
+                       help="Maximum number of LLM requests in flight at once (default: 10)")
+    parser.add_argument("--llm-rpm", type=int, default=0,
+                       help="Throttle LLM calls to this many requests per minute (default: unlimited)")
+    parser.add_argument("--llm-tpm", type=int, default=0,
+                       help="Throttle LLM calls to about this many tokens per minute (default: unlimited)")
+    parser.add_argument("--cache-dir", default="~/.cubemdl",
+                       help="Directory for the persistent LLM description cache (default: ~/.cubemdl)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Do not read or store cached LLM descriptions or introspection results")
+    parser.add_argument("--refresh-cache", action="store_true",
+                       help="Re-introspect all tables and overwrite the introspection cache in <output-dir>/.cache")
+    parser.add_argument("--llm-per-attribute", action="store_true",
+                       help="Send one LLM request per cube, measure and dimension instead of one per table")
+    parser.add_argument("--llm-tier", choices=LLM_TIERS, default="full",
+                       help="'cheap' templates counts, min/max, currency sums/averages and id/timestamp columns "
+                            "instead of asking the LLM")
+    parser.add_argument("--use-batch-api", action="store_true",
+                       help="Request table descriptions through the OpenAI Batch API (cheaper, may take hours)")
+    parser.add_argument("--batch-poll-interval", type=float, default=30.0,
+                       help="Seconds between Batch API job status checks (default: 30)")
     
     args = parser.parse_args()
     
@@ -339,8 +622,9 @@ Examples:
         schema=args.schema
     )
     
-    # Initialize components
-    introspector = PostgreSQLIntrospector(db_config)
+    # Initialize components (thread workers share one engine, so give each a pooled connection)
+    pool_size = max(5, args.workers) if args.use_threads else 5
+    introspector = PostgreSQLIntrospector(db_config, pool_size=pool_size)
     
     if not introspector.connect():
         logger.error("Failed to connect to database")
@@ -350,42 +634,64 @@ Examples:
         output_dir=args.output_dir,
         config_profile=args.domain,
         enable_llm=not args.no_llm,
-        llm_model=args.llm_model
+        llm_model=args.llm_model,
+        llm_concurrency=args.llm_concurrency,
+        llm_rpm=args.llm_rpm,
+        llm_tpm=args.llm_tpm,
+        llm_cache_dir=None if args.no_cache else args.cache_dir,
+        llm_batch_descriptions=not args.llm_per_attribute,
+        llm_tier=args.llm_tier,
+        llm_attribute_model=args.llm_attribute_model
     )
     
     # Process database
     try:
-        summary = generator.process_database_with_llm(introspector, args.tables)
-        
-        # Print summary
-        print("\n" + "="*60)
-        print("LLM-ENHANCED GENERATION SUMMARY")
-        print("="*60)
-        print(f"Total files generated: {summary['total_files']}")
-        print(f"Cubes: {summary['stats']['cubes']}")
-        print(f"Views: {summary['stats']['views']}")
-        print(f"LLM Enhanced: {summary['llm_enhanced']}")
-        print(f"Fact tables: {summary['stats']['fact_tables']}")
-        print(f"Dimension tables: {summary['stats']['dimension_tables']}")
-        print(f"Junction tables: {summary['stats']['junction_tables']}")
-        print(f"Errors: {summary['stats']['errors']}")
-        print(f"Output directory: {summary['output_directory']}")
+        # This thread's queries share one held connection for the whole run
+        with introspector:
+            summary = generator.process_database_with_llm(introspector, args.tables, use_batch_api=args.use_batch_api,
+                                                          batch_poll_interval=args.batch_poll_interval,
+                                                          use_cache=not args.no_cache, refresh_cache=args.refresh_cache,
+                                                          max_workers=args.workers, use_threads=args.use_threads)
+        
+        # Print summary, built up first and written in one call
+        stats = summary['stats']
+        lines = [
+            "",
+            "="*60,
+            "LLM-ENHANCED GENERATION SUMMARY",
+            "="*60,
+            f"Total files generated: {summary['total_files']}",
+            f"Cubes: {stats['cubes']}",
+            f"Views: {stats['views']}",
+            f"LLM Enhanced: {summary['llm_enhanced']}",
+            f"Fact tables: {stats['fact_tables']}",
+            f"Dimension tables: {stats['dimension_tables']}",
+            f"Junction tables: {stats['junction_tables']}",
+            f"Errors: {stats['errors']}",
+        ]
+        if 'llm_cache' in summary:
+            lines.append(f"LLM cache hits/misses: {summary['llm_cache']['hits']}/{summary['llm_cache']['misses']}")
+        lines.append(f"Output directory: {summary['output_directory']}")
         
         if summary['errors']:
-            print(f"\nErrors encountered:")
-            for error in summary['errors'][:3]:
-                print(f"  - {error}")
+            lines.append("\nErrors encountered:")
+            lines.extend(f"  - {error}" for error in summary['errors'][:3])
             if len(summary['errors']) > 3:
-                print(f"  ... and {len(summary['errors']) - 3} more")
+                lines.append(f"  ... and {len(summary['errors']) - 3} more")
         
-        print(f"\nNext steps:")
-        print("1. Review generated files with enhanced descriptions")
-        print("2. Copy files to your Cube.dev project")
-        print("3. Compare with basic descriptions to see improvements")
+        lines += [
+            "\nNext steps:",
+            "1. Review generated files with enhanced descriptions",
+            "2. Copy files to your Cube.dev project",
+            "3. Compare with basic descriptions to see improvements",
+        ]
+        print("\n".join(lines))
         
     except Exception as e:
         logger.error(f"Generation failed: {e}")
         sys.exit(1)
+    finally:
+        generator.close()
 
 if __name__ == "__main__":
     main()
@@ -7,17 +7,43 @@ and generates Cube.dev-compatible YAML files organized by data model type.
 """
 
 import os
+import re
 import sys
 import argparse
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import yaml
-from sqlalchemy import create_engine, MetaData, Table, Column, inspect
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, MetaData, Table, Column, inspect, text
+from sqlalchemy.engine import URL, Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+
+class _Dumper(_SafeDumper):
+    """Safe dumper that writes shared sub-structures (granularity lists) inline instead of as &id anchors"""
+    
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+class _FlowMapping(dict):
+    """Small mapping the dumper writes inline ({name: day, interval: 1 day}) instead of as a block"""
+
+_Dumper.add_representer(
+    _FlowMapping, lambda dumper, data: dumper.represent_mapping('tag:yaml.org,2002:map', data, flow_style=True)
+)
+
+# Inspector methods used by introspect_all, in the order their results are unpacked
+_MULTI_REFLECTION_METHODS = ('get_multi_columns', 'get_multi_pk_constraint', 'get_multi_foreign_keys', 'get_multi_indexes')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,17 +51,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Column name indicators used by table classification, compiled once into
+# alternations so each column is scored with a single search per category
+_FACT_INDICATOR_RE = re.compile('|'.join(map(re.escape, [
+    'amount', 'quantity', 'price', 'cost', 'value', 'total',
+    'count', 'revenue', 'profit', 'sales', 'transactions'
+])))
+_DIMENSION_INDICATOR_RE = re.compile('|'.join(map(re.escape, [
+    'name', 'title', 'description', 'category', 'type',
+    'status', 'code', 'label', 'classification'
+])))
+
+# Substring tests on lowercased SQL types ('char' also covers varchar)
+_FACT_TYPE_RE = re.compile(r'numeric|decimal|float')
+_DIMENSION_TYPE_RE = re.compile(r'text|char')
+
+# Granularities shared by every time dimension (the dumper writes each one inline, in full)
+_TIME_GRANULARITIES = (
+    _FlowMapping(name='day', interval='1 day'),
+    _FlowMapping(name='week', interval='1 week'),
+    _FlowMapping(name='month', interval='1 month'),
+    _FlowMapping(name='quarter', interval='1 quarter'),
+    _FlowMapping(name='year', interval='1 year')
+)
+
+# Measure types for numeric columns that match none of the common patterns
+_DEFAULT_MEASURE_TYPES = ('sum', 'avg', 'min', 'max')
+
+# Column name terms for currency formatting and low-cardinality pre-aggregation dimensions
+_CURRENCY_TERM_RE = re.compile(r'amount|price|cost|value|total')
+_PRE_AGG_DIMENSION_RE = re.compile(r'status|type|category|state')
+
+# Lowercased column names that get an 'active' segment, and terms that get a 'recent' one
+_ACTIVE_SEGMENT_COLUMNS = frozenset(['status', 'state', 'is_active', 'active'])
+_RECENT_SEGMENT_RE = re.compile(r'created_at|timestamp')
+
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database connection configuration"""
     host: str
     port: int
     database: str
     username: str
-    password: str
+    password: Optional[str]
     schema: str = 'public'
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """Information about a database table"""
     name: str
@@ -47,31 +108,89 @@ class TableInfo:
     is_fact_table: bool = False
     is_dimension_table: bool = False
     table_type: str = 'unknown'
+    
+    @property
+    def qualified_name(self) -> str:
+        """Schema-qualified table name, as used in sql_table"""
+        return f"{self.schema}.{self.name}"
 
 class PostgreSQLIntrospector:
     """Handles PostgreSQL database introspection"""
     
-    def __init__(self, config: DatabaseConfig):
+    def __init__(self, config: DatabaseConfig, pool_size: int = 5):
         self.config = config
+        self.pool_size = pool_size
         self.engine: Optional[Engine] = None
         self.metadata: Optional[MetaData] = None
-        self.inspector = None
-        
+        self._local = threading.local()
+    
+    @property
+    def inspector(self):
+        """SQLAlchemy inspector for the calling thread (inspectors keep an unsynchronized cache)"""
+        if self.engine is None:
+            return None
+        
+        inspector = getattr(self._local, 'inspector', None)
+        if inspector is None:
+            inspector = self._local.inspector = inspect(self.engine)
+        return inspector
+    
+    def __enter__(self) -> 'PostgreSQLIntrospector':
+        """Run the calling thread's queries on one held connection until __exit__"""
+        # Skips a pool checkout and reset-on-return ROLLBACK per query; autocommit keeps the
+        # connection from sitting idle in a transaction between tables. Other threads use the pool.
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0 and self.engine is not None:
+            connection = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            self._local.connection = connection
+            self._local.inspector = inspect(connection)
+        self._local.depth = depth + 1
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._local.depth -= 1
+        connection = getattr(self._local, 'connection', None)
+        if self._local.depth == 0 and connection is not None:
+            self._local.connection = self._local.inspector = None
+            connection.close()
+    
+    @contextmanager
+    def _connection(self) -> Iterator[Connection]:
+        """The calling thread's held connection, or a pooled one for the duration"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            yield connection
+            return
+        
+        with self.engine.connect() as connection:
+            yield connection
+    
     def connect(self) -> bool:
         """Establish database connection"""
         try:
-            connection_string = (
-                f"postgresql://{self.config.username}:{self.config.password}"
-                f"@{self.config.host}:{self.config.port}/{self.config.database}"
+            # URL.create escapes credentials containing '@', ':' or '/'; a missing password
+            # is left to libpq, which falls back to PGPASSWORD or ~/.pgpass
+            url = URL.create(
+                "postgresql",
+                username=self.config.username,
+                password=self.config.password,
+                host=self.config.host,
+                port=self.config.port,
+                database=self.config.database
             )
             
-            self.engine = create_engine(connection_string)
-            self.inspector = inspect(self.engine)
+            # The engine and its pool are shared; size the pool for concurrent callers.
+            # Catalog and sample queries are short, so JIT compilation would only add latency
+            self.engine = create_engine(
+                url,
+                pool_size=self.pool_size,
+                connect_args={'application_name': 'cubemdl', 'options': '-c jit=off'}
+            )
+            self._local = threading.local()
             self.metadata = MetaData()
             
             # Test connection
             with self.engine.connect() as conn:
-                from sqlalchemy import text
                 conn.execute(text("SELECT 1"))
                 
             logger.info(f"Successfully connected to database: {self.config.database}")
@@ -89,25 +208,69 @@ class PostgreSQLIntrospector:
     def introspect_table(self, table_name: str, schema: str = None) -> TableInfo:
         """Introspect a single table and return detailed information"""
         schema = schema or self.config.schema
+        inspector = self.inspector
+        
+        return self._build_table_info(
+            table_name,
+            schema,
+            inspector.get_columns(table_name, schema=schema),
+            inspector.get_pk_constraint(table_name, schema=schema),
+            inspector.get_foreign_keys(table_name, schema=schema),
+            inspector.get_indexes(table_name, schema=schema)
+        )
+    
+    def introspect_all(self, table_names: List[str] = None, schema: str = None) -> Dict[str, TableInfo]:
+        """Introspect many tables at once, with one batched catalog query per kind of metadata"""
+        schema = schema or self.config.schema
+        filter_names = table_names or None
+        
+        def reflect(method: str) -> Dict[Tuple[Optional[str], str], Any]:
+            # Each pool thread reflects through its own inspector and pooled connection
+            return getattr(self.inspector, method)(schema=schema, filter_names=filter_names)
+        
+        # SQLAlchemy 2.0 multi-table reflection, keyed by (schema, table_name); the four
+        # catalog queries are independent, so they overlap on separate connections
+        with ThreadPoolExecutor(max_workers=len(_MULTI_REFLECTION_METHODS)) as executor:
+            columns, pk_constraints, foreign_keys, indexes = executor.map(reflect, _MULTI_REFLECTION_METHODS)
+        
+        tables = {}
+        for key, table_columns in columns.items():
+            table_name = key[1]
+            tables[table_name] = self._build_table_info(
+                table_name,
+                schema,
+                table_columns,
+                pk_constraints.get(key) or {},
+                foreign_keys.get(key, []),
+                indexes.get(key, [])
+            )
         
-        # Get columns
+        return tables
+    
+    def _build_table_info(self, table_name: str, schema: str, reflected_columns: List[Dict[str, Any]],
+                          pk_constraint: Dict[str, Any], reflected_fks: List[Dict[str, Any]],
+                          reflected_indexes: List[Dict[str, Any]]) -> TableInfo:
+        """Build and classify a TableInfo from reflected table metadata"""
+        # Get columns. Names and type strings recur across tables (id, INTEGER, ...), so intern
+        # them once here and every dict, f-string and type-cache lookup shares one object;
+        # str() first because sys.intern rejects SQLAlchemy's quoted_name subclass
+        intern = sys.intern
         columns = []
-        for col in self.inspector.get_columns(table_name, schema=schema):
+        for col in reflected_columns:
             columns.append({
-                'name': col['name'],
-                'type': str(col['type']),
+                'name': intern(str(col['name'])),
+                'type': intern(str(col['type'])),
                 'nullable': col['nullable'],
                 'default': col.get('default'),
                 'autoincrement': col.get('autoincrement', False)
             })
         
         # Get primary keys
-        pk_constraint = self.inspector.get_pk_constraint(table_name, schema=schema)
         primary_keys = pk_constraint.get('constrained_columns', [])
         
         # Get foreign keys
         foreign_keys = []
-        for fk in self.inspector.get_foreign_keys(table_name, schema=schema):
+        for fk in reflected_fks:
             foreign_keys.append({
                 'constrained_columns': fk['constrained_columns'],
                 'referred_table': fk['referred_table'],
@@ -117,7 +280,7 @@ class PostgreSQLIntrospector:
         
         # Get indexes
         indexes = []
-        for idx in self.inspector.get_indexes(table_name, schema=schema):
+        for idx in reflected_indexes:
             indexes.append({
                 'name': idx['name'],
                 'columns': idx['column_names'],
@@ -141,41 +304,36 @@ class PostgreSQLIntrospector:
     def _classify_table(self, table_info: TableInfo) -> None:
         """Classify table as fact, dimension, or junction based on characteristics"""
         
-        # Check for fact table indicators
-        fact_indicators = [
-            'amount', 'quantity', 'price', 'cost', 'value', 'total',
-            'count', 'revenue', 'profit', 'sales', 'transactions'
-        ]
-        
-        # Check for dimension table indicators
-        dimension_indicators = [
-            'name', 'title', 'description', 'category', 'type',
-            'status', 'code', 'label', 'classification'
-        ]
-        
         # Check for junction table indicators
         junction_indicators = len(table_info.foreign_keys) >= 2
         
         # Count columns with different characteristics
         fact_score = 0
         dimension_score = 0
+        primary_keys = frozenset(table_info.primary_keys)
+        fact_search = _FACT_INDICATOR_RE.search
+        dimension_search = _DIMENSION_INDICATOR_RE.search
+        fact_type_search = _FACT_TYPE_RE.search
+        dimension_type_search = _DIMENSION_TYPE_RE.search
         
+        # Score every column in a single pass
         for col in table_info.columns:
-            col_name = col['name'].lower()
+            name = col['name']
+            col_name = name.lower()
             col_type = col['type'].lower()
             
             # Fact table scoring
-            if any(indicator in col_name for indicator in fact_indicators):
+            if fact_search(col_name):
                 fact_score += 2
-            if 'numeric' in col_type or 'decimal' in col_type or 'float' in col_type:
+            if fact_type_search(col_type):
                 fact_score += 1
-            if col_name.endswith('_id') and col['name'] not in table_info.primary_keys:
+            if col_name.endswith('_id') and name not in primary_keys:
                 fact_score += 1
                 
             # Dimension table scoring
-            if any(indicator in col_name for indicator in dimension_indicators):
+            if dimension_search(col_name):
                 dimension_score += 2
-            if 'varchar' in col_type or 'text' in col_type or 'char' in col_type:
+            if dimension_type_search(col_type):
                 dimension_score += 1
         
         # Classify table
@@ -190,17 +348,61 @@ class PostgreSQLIntrospector:
         else:
             table_info.table_type = 'generic'
     
+    def cache_key(self, schema: str = None) -> str:
+        """Identify the database and schema that introspection results belong to"""
+        schema = schema or self.config.schema
+        return f"{self.config.host}:{self.config.port}/{self.config.database}/{schema}"
+    
+    def get_table_fingerprints(self, schema: str = None) -> Optional[Dict[str, str]]:
+        """Return a token per table that changes whenever its columns, constraints or indexes change"""
+        schema = schema or self.config.schema
+        try:
+            with self._connection() as conn:
+                # Catalog rows get a new xmin on every DDL change; counts catch drops. Referenced
+                # tables are included because a rename changes this table's foreign keys
+                result = conn.execute(text("""
+                    SELECT c.relname, concat_ws(':',
+                        c.xmin::text,
+                        (SELECT max(a.xmin::text::bigint) FROM pg_attribute a WHERE a.attrelid = c.oid),
+                        (SELECT count(*) || '/' || coalesce(max(k.xmin::text::bigint), 0)
+                            FROM pg_constraint k WHERE k.conrelid = c.oid),
+                        (SELECT count(*) || '/' || coalesce(max(i.xmin::text::bigint), 0)
+                            FROM pg_index i WHERE i.indrelid = c.oid),
+                        (SELECT max(r.xmin::text::bigint) FROM pg_constraint k
+                            JOIN pg_class r ON r.oid = k.confrelid WHERE k.conrelid = c.oid))
+                    FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = :schema AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                """), {'schema': schema})
+                return {name: fingerprint for name, fingerprint in result}
+        except Exception as e:
+            logger.warning(f"Could not fingerprint tables in {schema}: {e}")
+            return None
+    
     def get_sample_data(self, table_name: str, schema: str = None, limit: int = 5) -> List[Dict]:
         """Get sample data from table for analysis"""
         schema = schema or self.config.schema
         try:
-            with self.engine.connect() as conn:
-                from sqlalchemy import text
-                result = conn.execute(text(f"SELECT * FROM {schema}.{table_name} LIMIT {limit}"))
-                return [dict(row._mapping) for row in result]
+            # Quote the identifiers (reflected names may be mixed-case or contain spaces) and bind the limit
+            preparer = self.engine.dialect.identifier_preparer
+            query = text(f"SELECT * FROM {preparer.quote_schema(schema)}.{preparer.quote(table_name)} LIMIT :limit")
+            with self._connection() as conn:
+                result = conn.execute(query, {'limit': limit})
+                # Look the column names up once, not through each row's mapping view
+                keys = list(result.keys())
+                return [dict(zip(keys, row)) for row in result]
         except Exception as e:
             logger.warning(f"Could not fetch sample data from {table_name}: {e}")
             return []
+    
+    def get_sample_data_bulk(self, table_names: List[str], schema: str = None, limit: int = 5) -> Dict[str, List[Dict]]:
+        """Get sample data from many tables, with up to pool_size queries in flight at once"""
+        if not table_names:
+            return {}
+        
+        # Tables have unrelated columns, so each keeps its own query; the pool overlaps their round trips
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(table_names))) as executor:
+            samples = executor.map(lambda table_name: self.get_sample_data(table_name, schema, limit), table_names)
+            return dict(zip(table_names, samples))
 
 class CubeYAMLGenerator:
     """Generates Cube.dev YAML files from database schema"""
@@ -214,6 +416,10 @@ class CubeYAMLGenerator:
         self.cubes_dir.mkdir(parents=True, exist_ok=True)
         self.views_dir.mkdir(parents=True, exist_ok=True)
         
+        # Plain string prefixes so each save joins a filename without building a Path
+        self._cubes_prefix = str(self.cubes_dir) + os.sep
+        self._views_prefix = str(self.views_dir) + os.sep
+        
         # Column type mappings
         self.type_mappings = {
             'integer': 'number',
@@ -240,6 +446,9 @@ class CubeYAMLGenerator:
             'jsonb': 'string'
         }
         
+        # Raw SQL type string -> Cube.dev type, filled lazily by map_sql_type_to_cube
+        self._cube_type_cache: Dict[str, str] = {}
+        
         self.common_measures = {
             'amount': ['sum', 'avg', 'min', 'max'],
             'price': ['sum', 'avg', 'min', 'max'],
@@ -251,15 +460,30 @@ class CubeYAMLGenerator:
             'score': ['avg', 'min', 'max'],
             'rating': ['avg', 'min', 'max']
         }
+        
+        # One lookahead branch per pattern, in dict order, so match().lastindex picks the
+        # first pattern contained in a name, as the original ordered scan did
+        self._measure_types_by_group = list(self.common_measures.values())
+        self._measure_pattern_re = re.compile('|'.join(
+            f"(?=.*?({re.escape(pattern)}))" for pattern in self.common_measures
+        ))
+        
+        # Title-cased measure types for descriptions ("Sum of ..."), including the fallback set
+        self._measure_titles = {
+            measure_type: measure_type.title()
+            for measure_types in (*self._measure_types_by_group, _DEFAULT_MEASURE_TYPES)
+            for measure_type in measure_types
+        }
     
     def map_sql_type_to_cube(self, sql_type: str) -> str:
-        """Map SQL type to Cube.dev type"""
-        sql_type_lower = sql_type.lower()
-        
-        # Handle parameterized types
-        base_type = sql_type_lower.split('(')[0]
-        
-        return self.type_mappings.get(base_type, 'string')
+        """Map SQL type to Cube.dev type (memoized per raw type string)"""
+        cube_type = self._cube_type_cache.get(sql_type)
+        if cube_type is None:
+            # Handle parameterized types (partition avoids building a list)
+            base_type = sql_type.lower().partition('(')[0]
+            
+            cube_type = self._cube_type_cache[sql_type] = self.type_mappings.get(base_type, 'string')
+        return cube_type
     
     def generate_cube_from_table(self, table_info: TableInfo) -> Dict[str, Any]:
         """Generate a cube definition from table information"""
@@ -269,7 +493,7 @@ class CubeYAMLGenerator:
         # Base cube structure
         cube = {
             'name': cube_name,
-            'sql_table': f"{table_info.schema}.{table_info.name}",
+            'sql_table': table_info.qualified_name,
             'description': f"Generated cube for {table_info.name} table"
         }
         
@@ -323,20 +547,21 @@ class CubeYAMLGenerator:
             })
         
         # Generate measures for numeric columns
+        primary_keys = frozenset(table_info.primary_keys)
+        currency_search = _CURRENCY_TERM_RE.search
+        measure_match = self._measure_pattern_re.match
+        measure_types_by_group = self._measure_types_by_group
+        measure_titles = self._measure_titles
         for col in table_info.columns:
             cube_type = self.map_sql_type_to_cube(col['type'])
-            col_name = col['name'].lower()
             
-            if cube_type == 'number' and col['name'] not in table_info.primary_keys:
-                
-                # Determine appropriate measure types
-                measure_types = ['sum', 'avg', 'min', 'max']
+            if cube_type == 'number' and col['name'] not in primary_keys:
+                col_name = col['name'].lower()
                 
-                # Check for common measure patterns
-                for pattern, types in self.common_measures.items():
-                    if pattern in col_name:
-                        measure_types = types
-                        break
+                # Determine appropriate measure types from the first common pattern present
+                m = measure_match(col_name)
+                measure_types = measure_types_by_group[m.lastindex - 1] if m else _DEFAULT_MEASURE_TYPES
+                is_currency = currency_search(col_name) is not None
                 
                 # Generate measures
                 for measure_type in measure_types:
@@ -345,11 +570,11 @@ class CubeYAMLGenerator:
                         'name': measure_name,
                         'sql': col['name'],
                         'type': measure_type,
-                        'description': f"{measure_type.title()} of {col['name']}"
+                        'description': f"{measure_titles[measure_type]} of {col['name']}"
                     }
                     
                     # Add format for financial columns
-                    if any(term in col_name for term in ['amount', 'price', 'cost', 'value', 'total']):
+                    if is_currency:
                         measure['format'] = 'currency'
                     
                     measures.append(measure)
@@ -359,6 +584,7 @@ class CubeYAMLGenerator:
     def _generate_dimensions(self, table_info: TableInfo) -> List[Dict[str, Any]]:
         """Generate dimensions for the cube"""
         dimensions = []
+        primary_keys = frozenset(table_info.primary_keys)
         
         for col in table_info.columns:
             cube_type = self.map_sql_type_to_cube(col['type'])
@@ -371,18 +597,12 @@ class CubeYAMLGenerator:
             }
             
             # Mark primary key
-            if col['name'] in table_info.primary_keys:
+            if col['name'] in primary_keys:
                 dimension['primary_key'] = True
             
             # Add granularities for time dimensions
             if cube_type == 'time':
-                dimension['granularities'] = [
-                    {'name': 'day', 'interval': '1 day'},
-                    {'name': 'week', 'interval': '1 week'},
-                    {'name': 'month', 'interval': '1 month'},
-                    {'name': 'quarter', 'interval': '1 quarter'},
-                    {'name': 'year', 'interval': '1 year'}
-                ]
+                dimension['granularities'] = list(_TIME_GRANULARITIES)
             
             dimensions.append(dimension)
         
@@ -406,13 +626,14 @@ class CubeYAMLGenerator:
     def _generate_segments(self, table_info: TableInfo) -> List[Dict[str, Any]]:
         """Generate common segments"""
         segments = []
+        recent_search = _RECENT_SEGMENT_RE.search
         
         # Check for common segment patterns
         for col in table_info.columns:
             col_name = col['name'].lower()
             
             # Active/status segments
-            if col_name in ['status', 'state', 'is_active', 'active']:
+            if col_name in _ACTIVE_SEGMENT_COLUMNS:
                 segments.append({
                     'name': 'active',
                     'sql': f"{{CUBE}}.{col['name']} = 'active'",
@@ -420,7 +641,7 @@ class CubeYAMLGenerator:
                 })
             
             # Date-based segments
-            if 'created_at' in col_name or 'timestamp' in col_name:
+            if recent_search(col_name):
                 segments.append({
                     'name': 'recent',
                     'sql': f"{{CUBE}}.{col['name']} >= CURRENT_DATE - INTERVAL '30 days'",
@@ -453,11 +674,8 @@ class CubeYAMLGenerator:
             }
             
             # Add dimensions with low cardinality
-            dimensions = []
-            for col in table_info.columns:
-                col_name = col['name'].lower()
-                if any(term in col_name for term in ['status', 'type', 'category', 'state']):
-                    dimensions.append(col['name'])
+            dimension_search = _PRE_AGG_DIMENSION_RE.search
+            dimensions = [col['name'] for col in table_info.columns if dimension_search(col['name'].lower())]
             
             if dimensions:
                 pre_agg['dimensions'] = dimensions[:3]  # Limit to 3 dimensions
@@ -492,32 +710,36 @@ class CubeYAMLGenerator:
         if not filename:
             filename = f"{cube['name']}.yml"
         
-        filepath = self.cubes_dir / filename
+        filepath = self._cubes_prefix + filename
         
         # Wrap in cubes array for proper YAML structure
         yaml_content = {'cubes': [cube]}
         
-        with open(filepath, 'w') as f:
-            yaml.dump(yaml_content, f, default_flow_style=False, sort_keys=False, indent=2)
+        # The emitter buffers and encodes itself, so write its bytes without a text layer
+        with open(filepath, 'wb') as f:
+            yaml.dump(yaml_content, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, indent=2,
+                      encoding='utf-8')
         
-        logger.info(f"Generated cube YAML: {filepath}")
-        return str(filepath)
+        logger.info("Generated cube YAML: %s", filepath)
+        return filepath
     
     def save_view_yaml(self, view: Dict[str, Any], filename: str = None) -> str:
         """Save view definition to YAML file"""
         if not filename:
             filename = f"{view['name']}.yml"
         
-        filepath = self.views_dir / filename
+        filepath = self._views_prefix + filename
         
         # Wrap in views array for proper YAML structure
         yaml_content = {'views': [view]}
         
-        with open(filepath, 'w') as f:
-            yaml.dump(yaml_content, f, default_flow_style=False, sort_keys=False, indent=2)
+        # The emitter buffers and encodes itself, so write its bytes without a text layer
+        with open(filepath, 'wb') as f:
+            yaml.dump(yaml_content, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, indent=2,
+                      encoding='utf-8')
         
-        logger.info(f"Generated view YAML: {filepath}")
-        return str(filepath)
+        logger.info("Generated view YAML: %s", filepath)
+        return filepath
 
 def main():
     """Main function to orchestrate the generation process"""
@@ -526,7 +748,7 @@ def main():
     parser.add_argument("--port", type=int, default=5432, help="PostgreSQL port")
     parser.add_argument("--database", required=True, help="Database name")
     parser.add_argument("--username", required=True, help="Database username")
-    parser.add_argument("--password", required=True, help="Database password")
+    parser.add_argument("--password", help="Database password (default: PGPASSWORD or ~/.pgpass)")
     parser.add_argument("--schema", default="public", help="Database schema")
     parser.add_argument("--output-dir", default="model", help="Output directory for YAML files")
     parser.add_argument("--tables", nargs="*", help="Specific tables to process (default: all)")
@@ -564,26 +786,44 @@ def main():
     
     cube_names = []
     
-    # Process each table
-    for table_name in tables:
+    # Reflect all tables up front in a few batched queries
+    try:
+        table_infos = introspector.introspect_all(tables, args.schema)
+    except Exception as e:
+        logger.warning(f"Batch introspection failed, introspecting tables one by one: {e}")
+        table_infos = {}
+    
+    # Process each table; file writes run on a small pool so they overlap with generating the next cube
+    pending_saves = []
+    with ThreadPoolExecutor(max_workers=4) as writer:
+        for table_name in tables:
+            try:
+                logger.info("Processing table: %s", table_name)
+                
+                # Introspect table
+                table_info = table_infos.pop(table_name, None)
+                if table_info is None:
+                    table_info = introspector.introspect_table(table_name, args.schema)
+                
+                # Generate cube
+                cube = generator.generate_cube_from_table(table_info)
+                
+                # Save cube YAML
+                pending_saves.append((table_name, cube['name'], table_info.table_type,
+                                      writer.submit(generator.save_cube_yaml, cube)))
+                
+            except Exception as e:
+                logger.error(f"Error processing table {table_name}: {e}")
+                continue
+    
+    # Collect the writes in table order, so a failed save is still reported against its table
+    for table_name, cube_name, table_type, save in pending_saves:
         try:
-            logger.info(f"Processing table: {table_name}")
-            
-            # Introspect table
-            table_info = introspector.introspect_table(table_name, args.schema)
-            
-            # Generate cube
-            cube = generator.generate_cube_from_table(table_info)
-            
-            # Save cube YAML
-            generator.save_cube_yaml(cube)
-            cube_names.append(cube['name'])
-            
-            logger.info(f"Generated cube for {table_name} (type: {table_info.table_type})")
-            
+            save.result()
+            cube_names.append(cube_name)
+            logger.info("Generated cube for %s (type: %s)", table_name, table_type)
         except Exception as e:
             logger.error(f"Error processing table {table_name}: {e}")
-            continue
     
     # Generate views if requested
     if args.generate_views and cube_names:
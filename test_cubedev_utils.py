@@ -0,0 +1,45 @@
+"""Tests for cubedev_utils (run with ``python -m unittest``)"""
+
+import unittest
+
+from cubedev_utils import BackgroundWriter, YAMLFormatter
+
+_UNSAFE_YAML = 'a: !!python/object/apply:os.system ["echo hi"]\n'
+
+
+class ValidateYAMLSyntaxTest(unittest.TestCase):
+    """YAMLFormatter.validate_yaml_syntax accepts safe YAML and rejects unsafe tags at any size"""
+    
+    def test_accepts_safe_yaml(self):
+        self.assertEqual(YAMLFormatter.validate_yaml_syntax('cubes:\n- name: orders\n'), (True, None))
+    
+    def test_rejects_empty_yaml(self):
+        self.assertFalse(YAMLFormatter.validate_yaml_syntax('  \n')[0])
+    
+    def test_rejects_unsafe_tag(self):
+        self.assertFalse(YAMLFormatter.validate_yaml_syntax(_UNSAFE_YAML)[0])
+    
+    def test_rejects_unsafe_tag_in_large_document(self):
+        padding = ''.join(f'k{i}: {"x" * 100}\n' for i in range(12000))
+        self.assertGreater(len(padding), 1 << 20)
+        self.assertFalse(YAMLFormatter.validate_yaml_syntax(padding + _UNSAFE_YAML)[0])
+
+
+
+class BackgroundWriterTest(unittest.TestCase):
+    """BackgroundWriter resolves every future in order and survives failing saves"""
+    
+    def test_keeps_draining_after_base_exception(self):
+        def fail():
+            raise SystemExit(1)
+        
+        with BackgroundWriter(max_pending=1) as writer:
+            failed = writer.submit(fail)
+            later = [writer.submit(pow, 2, n) for n in range(3)]
+        
+        self.assertIsInstance(failed.exception(timeout=5), SystemExit)
+        self.assertEqual([future.result(timeout=5) for future in later], [1, 2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()